@@ -0,0 +1,5 @@
+"""Micro-benchmarks for the labelprinterkit hot paths.
+
+Run a single benchmark with e.g. ``python -m benchmarks.encode`` from the
+repository root. ``python -m benchmarks.suite`` runs the regression suite,
+which reports JSON and compares it against ``benchmarks/baseline.json``."""
@@ -0,0 +1,39 @@
+"""Labels per second of render_pages with a growing number of worker processes"""
+from __future__ import annotations
+
+import os
+from time import perf_counter
+
+from labelprinterkit.batch import render_pages
+from labelprinterkit.labels.box import Box
+from labelprinterkit.labels.text import Text
+
+RECORDS = 2000
+FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+def asset_label(record: dict) -> Box:
+    return Box(
+        70,
+        Text(35, record["name"], FONT, cache=False),
+        Text(35, record["room"], FONT, cache=False),
+        vertical=True,
+    )
+
+
+def records():
+    for i in range(RECORDS):
+        yield {"name": f"Asset {i:05d}", "room": f"Room {i % 97}"}
+
+
+def main():
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    for workers in counts:
+        start = perf_counter()
+        pages = sum(1 for _ in render_pages(asset_label, records(), workers))
+        elapsed = perf_counter() - start
+        print(f"{workers:>2} worker(s): {pages / elapsed:>8.0f} labels/s")
+
+
+if __name__ == "__main__":
+    main()
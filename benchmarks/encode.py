@@ -0,0 +1,43 @@
+"""Compare the per-line encode_line loop with the batch encode_page encoder."""
+from __future__ import annotations
+
+import random
+from math import ceil
+from timeit import timeit
+
+from labelprinterkit.constants import Media
+from labelprinterkit.printers import encode_line, encode_page
+
+LINES = 5000
+REPEAT = 5
+
+
+def random_bitmap(width: int, lines: int) -> bytes:
+    byte_per_line = ceil(width / 8)
+    rng = random.Random(width)
+    # mostly blank and solid bytes, like rendered text
+    return bytes(rng.choice((0x00, 0x00, 0x00, 0xFF, 0x3C)) for _ in range(byte_per_line * lines))
+
+
+def per_line(bitmap: bytes, width: int, padding: int) -> bytes:
+    byte_per_line = ceil(width / 8)
+    return b"".join(
+        b"G" + encode_line(bitmap[i : i + byte_per_line], padding) for i in range(0, len(bitmap), byte_per_line)
+    )
+
+
+def main():
+    print(f"{'media':<6} {'encode_line':>14} {'encode_page':>14} {'speedup':>8}")
+    for media in Media:
+        width, padding = media.value.printarea, media.value.lmargin
+        if not width:
+            continue
+        bitmap = random_bitmap(width, LINES)
+        assert per_line(bitmap, width, padding) == encode_page(bitmap, width, padding)
+        old = timeit(lambda: per_line(bitmap, width, padding), number=REPEAT)
+        new = timeit(lambda: encode_page(bitmap, width, padding), number=REPEAT)
+        print(f"{media.name:<6} {LINES * REPEAT / old:>10.0f} l/s {LINES * REPEAT / new:>10.0f} l/s {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
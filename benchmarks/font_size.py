@@ -0,0 +1,80 @@
+"""Compare the font size solver of Text with the previous implementation,
+which loaded the font from disk for every probe.
+
+Usage: python -m benchmarks.font_size [FONT_PATH]"""
+from __future__ import annotations
+
+import random
+import sys
+from math import ceil
+from time import perf_counter
+
+from PIL import Image, ImageDraw, ImageFont
+
+from labelprinterkit.labels.text import Text
+from labelprinterkit.utils.image import crop
+
+STRINGS = 10000
+DISTINCT = 2000
+OLD_SAMPLE = 200
+HEIGHTS = (25, 45, 70)
+FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+def old_calc_font_size(font_path: str, text: str, height: int) -> int:
+    def text_height(size):
+        font = ImageFont.truetype(font_path, size)
+        left, top, right, bottom = font.getbbox(text)
+        image = Image.new("1", (right - left, bottom - top), "white")
+        ImageDraw.Draw(image).text((0, 0), text, "black", font)
+        return crop(image).size[1]
+
+    lower = 1
+    upper = 1
+    while True:
+        if text_height(upper) >= height:
+            break
+        lower = upper
+        upper *= 2
+    while True:
+        test = ceil((upper + lower) / 2)
+        font_height = text_height(test)
+        if upper - lower <= 1:
+            return lower
+        elif font_height > height:
+            upper = test
+        elif font_height < height:
+            lower = test
+        else:
+            return test
+
+
+def asset_strings() -> list[tuple[str, int]]:
+    rng = random.Random(0)
+    distinct = [
+        (f"{rng.choice(('SRV', 'SW', 'AP', 'PC'))}-{rng.randrange(10000):04d}", rng.choice(HEIGHTS))
+        for _ in range(DISTINCT)
+    ]
+    return [rng.choice(distinct) for _ in range(STRINGS)]
+
+
+def main():
+    font_path = sys.argv[1] if len(sys.argv) > 1 else FONT
+    strings = asset_strings()
+
+    start = perf_counter()
+    old = [old_calc_font_size(font_path, text, height) for text, height in strings[:OLD_SAMPLE]]
+    old_time = (perf_counter() - start) / OLD_SAMPLE
+
+    start = perf_counter()
+    new = [Text(height, text, font_path)._calc_font_size(height) for text, height in strings]
+    new_time = (perf_counter() - start) / STRINGS
+
+    assert old == new[:OLD_SAMPLE]
+    print(f"previous solver: {old_time * 1000:.3f} ms/string ({OLD_SAMPLE} strings)")
+    print(f"current solver:  {new_time * 1000:.3f} ms/string ({STRINGS} strings, {DISTINCT} distinct)")
+    print(f"speedup: {old_time / new_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Render time of nested boxes, composing rendered child images level by
+level as Box did before, compared with measuring first and drawing every item
+straight into one image. Text renderings are cached in both cases."""
+from __future__ import annotations
+
+from timeit import timeit
+
+from PIL import Image
+
+from labelprinterkit.labels import Item
+from labelprinterkit.labels.box import Box
+from labelprinterkit.labels.qrcode import QRCode
+from labelprinterkit.labels.text import Text
+
+FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+REPEAT = 200
+
+
+def pasted(item: Item) -> Image.Image:
+    if not isinstance(item, Box):
+        return item.render()
+    rendered_images = [pasted(child) for child in item.items]
+    if item._vertical:
+        length = max([image.size[0] for image in rendered_images]) + item._left_padding
+        image = Image.new("1", (length, item.height), "white")
+        xpos = 0
+        for rendered_image in rendered_images:
+            image.paste(rendered_image, (item._left_padding, xpos))
+            xpos += rendered_image.size[1]
+    else:
+        length = sum([image.size[0] for image in rendered_images]) + item._left_padding
+        image = Image.new("1", (length, item.height), "white")
+        ypos = item._left_padding
+        for rendered_image in rendered_images:
+            image.paste(rendered_image, (ypos, 0))
+            ypos += rendered_image.size[0]
+    return image
+
+
+def label(depth: int) -> Item:
+    if depth == 0:
+        return Box(32, Text(32, "Port", FONT), Text(32, "42", FONT))
+    return Box(32 * 2 ** depth, label(depth - 1), label(depth - 1), vertical=True)
+
+
+def main():
+    print(f"{'depth':<6} {'pasted':>10} {'measured':>10} {'speedup':>8}")
+    for depth in range(1, 4):
+        item = Box(32 * 2 ** depth, QRCode(32 * 2 ** depth, "https://example.com"), label(depth))
+        assert pasted(item).tobytes() == item.render().tobytes()
+        old = timeit(lambda: pasted(item), number=REPEAT) / REPEAT
+        new = timeit(item.render, number=REPEAT) / REPEAT
+        print(f"{depth:<6} {old * 1e6:>7.0f} us {new * 1e6:>7.0f} us {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
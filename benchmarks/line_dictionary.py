@@ -0,0 +1,75 @@
+"""Bytes and encoding time of a corpus of typical labels with the plain page
+encoder, with a line cache shared by the job and with blank lines sent as Z
+command, compared with encoding every line on its own."""
+from __future__ import annotations
+
+from math import ceil
+from time import perf_counter
+
+from labelprinterkit.constants import Media
+from labelprinterkit.labels.box import Box
+from labelprinterkit.labels.flag import Flag
+from labelprinterkit.labels.label import Label
+from labelprinterkit.labels.qrcode import QRCode
+from labelprinterkit.labels.text import Padding, Text
+from labelprinterkit.printers import encode_line, encode_page
+
+FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+REPEAT = 20
+
+
+def corpus() -> list[tuple[Media, Label | Flag]]:
+    labels = []
+    for i in range(10):
+        labels.append((Media.W12, Label(Text(70, f"Port {i + 1}", FONT))))
+        labels.append((Media.W24, Label(Box(128, Text(64, f"Asset {i:05d}", FONT),
+                                            Text(64, "Networking", FONT, padding=Padding(10, 0, 0, 0)),
+                                            vertical=True))))
+        labels.append((Media.W24, Label(QRCode(128, f"https://example.com/asset/{i:05d}"))))
+        labels.append((Media.W24, Flag(Text(128, f"sw{i}-eth0", FONT), Text(128, f"patch {i}", FONT))))
+    return labels
+
+
+def per_line(bitmap: bytes, width: int, padding: int) -> bytes:
+    byte_per_line = ceil(width / 8)
+    return b"".join(
+        b"G" + encode_line(bitmap[i : i + byte_per_line], padding) for i in range(0, len(bitmap), byte_per_line)
+    )
+
+
+def run(labels, encode, caches: dict) -> tuple[int, float]:
+    size = 0
+    start = perf_counter()
+    for _ in range(REPEAT):
+        # every pass over the corpus is a new set of jobs
+        caches.clear()
+        size = 0
+        for media, label in labels:
+            size += len(encode(media, label))
+    return size, (perf_counter() - start) / REPEAT
+
+
+def main():
+    labels = corpus()
+    raw = sum(len(label.bitmap) for _, label in labels)
+    # one line cache per job, a job per media here
+    caches: dict[Media, dict] = {}
+
+    def cached(media, label, zero_raster=False):
+        cache = caches.setdefault((media, zero_raster), {})
+        return encode_page(label.raster, label.width, media.value.lmargin, cache, zero_raster)
+
+    print(f"{len(labels)} labels, {raw} raw bytes")
+    print(f"{'':<18} {'bytes':>8} {'ratio':>6} {'time':>10}")
+    for name, encode in (
+        ("encode_line", lambda media, label: per_line(label.bitmap, label.width, media.value.lmargin)),
+        ("encode_page", lambda media, label: encode_page(label.raster, label.width, media.value.lmargin)),
+        ("line cache", cached),
+        ("line cache + Z", lambda media, label: cached(media, label, True)),
+    ):
+        size, seconds = run(labels, encode, caches)
+        print(f"{name:<18} {size:>8} {raw / size:>6.2f} {seconds * 1000:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Allocations of reading a 10k line page through copies, as pages did before,
+and through memoryviews of the bitmap.
+
+Peak is the largest amount of traced memory while walking the page, retained
+the memory and number of blocks held by the list of all lines. The page is
+built from a bytearray, like a bitmap assembled in place or read from disk."""
+from __future__ import annotations
+
+import random
+import tracemalloc
+from math import ceil
+from typing import Callable
+
+from labelprinterkit.constants import Media
+from labelprinterkit.page import Page
+from labelprinterkit.printers import GenericPrinter, encode_page
+
+LINES = 10000
+CHUNK_LINES = GenericPrinter._CHUNK_LINES
+
+
+def copied_lines(page: Page):
+    bitmap = page.bitmap
+    step = ceil(page.width / 8)
+    return [bitmap[i : i + step] for i in range(0, len(bitmap), step)]
+
+
+def copied_encode(page: Page):
+    bitmap = page.bitmap
+    size = CHUNK_LINES * ceil(page.width / 8)
+    for i in range(0, len(bitmap), size):
+        encode_page(bitmap[i : i + size], page.width, 0)
+
+
+def viewed_encode(page: Page):
+    for chunk in page.chunks(CHUNK_LINES):
+        encode_page(chunk, page.width, 0)
+
+
+def measure(function: Callable, page: Page) -> tuple[int, int, int]:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = function(page)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    retained = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del result
+    return peak, retained, blocks
+
+
+def main():
+    width = Media.W24.value.printarea
+    rng = random.Random(0)
+    bitmap = bytearray(rng.getrandbits(8) for _ in range(ceil(width / 8) * LINES))
+    page = Page(bitmap, width, LINES)
+    print(f"{'':<16} {'peak':>10} {'retained':>10} {'blocks':>8}")
+    for name, function in (
+        ("lines, copied", copied_lines),
+        ("lines, views", list),
+        ("encode, copied", copied_encode),
+        ("encode, views", viewed_encode),
+    ):
+        peak, retained, blocks = measure(function, page)
+        print(f"{name:<16} {peak:>10} {retained:>10} {blocks:>8}")
+
+
+if __name__ == "__main__":
+    main()
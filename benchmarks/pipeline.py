@@ -0,0 +1,63 @@
+"""End to end time of rendering and printing a batch of labels, sequentially
+and with PipelinedPrinter, against a simulated printer moving LINES_PER_SECOND
+raster lines per second and taking CUT_SECONDS for every cut."""
+from __future__ import annotations
+
+from time import monotonic, perf_counter, sleep
+
+from labelprinterkit.backends.simulated import SimulatedBackend
+from labelprinterkit.constants import Media
+from labelprinterkit.job import Job
+from labelprinterkit.labels.box import Box
+from labelprinterkit.labels.label import Label
+from labelprinterkit.labels.text import Text
+from labelprinterkit.printers import GenericPrinter
+from labelprinterkit.printers.pipeline import PipelinedPrinter
+
+LABELS = 20
+LINES_PER_SECOND = 20000
+CUT_SECONDS = 0.02
+FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+def item(i: int) -> Box:
+    return Box(70, Text(35, f"Asset {i:05d}", FONT, cache=False), Text(35, f"Room {i % 97}", FONT, cache=False),
+               vertical=True)
+
+
+def simulated_printer() -> SimulatedBackend:
+    return SimulatedBackend(Media.W12, lines_per_second=LINES_PER_SECOND, cut_time=CUT_SECONDS)
+
+
+def wait_idle(backend: SimulatedBackend) -> None:
+    sleep(max(0.0, backend.idle_at - monotonic()))
+
+
+def sequential() -> float:
+    backend = simulated_printer()
+    start = perf_counter()
+    job = Job(Media.W12)
+    for i in range(LABELS):
+        job.add_page(Label(item(i)))
+    GenericPrinter(backend).print(job)
+    wait_idle(backend)
+    return perf_counter() - start
+
+
+def pipelined(workers: int) -> float:
+    backend = simulated_printer()
+    start = perf_counter()
+    PipelinedPrinter(GenericPrinter(backend), render_workers=workers).print(
+        Job(Media.W12), (item(i) for i in range(LABELS)))
+    wait_idle(backend)
+    return perf_counter() - start
+
+
+def main():
+    print(f"sequential:              {sequential():.2f} s")
+    for workers in (1, 2, 4):
+        print(f"pipelined, {workers} worker(s):  {pipelined(workers):.2f} s")
+
+
+if __name__ == "__main__":
+    main()
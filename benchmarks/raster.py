@@ -0,0 +1,55 @@
+"""Time and intermediate memory of converting a 24mm x 1m banner between image
+and printer raster, compared with the previous rotate, flip and invert chain.
+
+Pillow allocates image memory outside of the Python allocator, so the memory
+is given as the size of the intermediate images, one byte per pixel for
+mode "1"."""
+from __future__ import annotations
+
+import random
+from timeit import timeit
+
+from PIL import Image, ImageChops
+
+from labelprinterkit.utils.image import bitmap_to_image, image_to_bitmap
+
+WIDTH = 128  # print area of 24mm tape
+LENGTH = 7087  # 1m at 180 dpi
+REPEAT = 20
+
+
+def old_image_to_bitmap(image: Image.Image):
+    image = image.transpose(Image.ROTATE_270).transpose(Image.FLIP_TOP_BOTTOM)
+    image = ImageChops.invert(image)
+    return image.tobytes(), image.size[0], image.size[1]
+
+
+def old_bitmap_to_image(bitmap: bytes, width: int, length: int) -> Image.Image:
+    image = Image.frombytes("1", (width, length), bitmap)
+    image = image.transpose(Image.FLIP_TOP_BOTTOM)
+    image = image.transpose(Image.ROTATE_90)
+    return ImageChops.invert(image)
+
+
+def report(name: str, func, intermediate_images: int) -> None:
+    seconds = timeit(func, number=REPEAT) / REPEAT
+    memory = intermediate_images * WIDTH * LENGTH
+    print(f"{name:<28} {seconds * 1000:>8.2f} ms {memory / 1024:>8.0f} KiB in intermediate images")
+
+
+def main():
+    rng = random.Random(0)
+    banner = Image.new("1", (LENGTH, WIDTH), "white")
+    banner.putdata([rng.choice((0, 255)) for _ in range(LENGTH * WIDTH)])
+    bitmap, width, length = image_to_bitmap(banner)
+    assert (bitmap, width, length) == old_image_to_bitmap(banner)
+    assert bitmap_to_image(bitmap, width, length).tobytes() == old_bitmap_to_image(bitmap, width, length).tobytes()
+
+    report("image_to_bitmap (previous)", lambda: old_image_to_bitmap(banner), 3)
+    report("image_to_bitmap", lambda: image_to_bitmap(banner), 1)
+    report("bitmap_to_image (previous)", lambda: old_bitmap_to_image(bitmap, width, length), 4)
+    report("bitmap_to_image", lambda: bitmap_to_image(bitmap, width, length), 2)
+
+
+if __name__ == "__main__":
+    main()
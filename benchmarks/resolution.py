@@ -0,0 +1,53 @@
+"""Wall time per millimetre of label for building and printing a batch of
+labels at both resolutions, against a backend that discards the data. The
+items are rendered once up front, as repeated labels hit the render caches."""
+from __future__ import annotations
+
+from time import perf_counter
+
+from labelprinterkit.backends import UniDirectionalBackend
+from labelprinterkit.constants import Media, Resolution
+from labelprinterkit.job import Job
+from labelprinterkit.labels.box import Box
+from labelprinterkit.labels.label import Label
+from labelprinterkit.labels.qrcode import QRCode
+from labelprinterkit.labels.text import Text
+from labelprinterkit.printers import GenericPrinter
+
+LABELS = 50
+FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+class NullBackend(UniDirectionalBackend):
+    def write(self, data: bytes, timeout=None) -> None:
+        pass
+
+
+def item(i: int) -> Box:
+    return Box(128, QRCode(128, f"https://example.com/asset/{i % 10:05d}"),
+               Text(128, f"Asset {i % 10:05d}", FONT))
+
+
+def run(resolution: Resolution) -> tuple[float, float]:
+    start = perf_counter()
+    job = Job(Media.W24, resolution=resolution)
+    for i in range(LABELS):
+        job.add_page(Label(item(i), resolution))
+    GenericPrinter(NullBackend()).print(job)
+    seconds = perf_counter() - start
+    _, feed_dpi = resolution.value
+    millimetres = sum(page.length for page in job) / feed_dpi * 25.4
+    return seconds, millimetres
+
+
+def main():
+    # render every item once, both resolutions reuse the cached renderings
+    run(Resolution.LOW)
+    for resolution in Resolution:
+        seconds, millimetres = run(resolution)
+        print(f"{resolution.name:<5} {millimetres:>7.0f} mm {seconds * 1000:>8.1f} ms "
+              f"{seconds * 1000 / millimetres:>6.3f} ms/mm")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Status replies parsed per second, compared with the previous parser that
+built the enum lookup tables and an error dict for every reply.
+
+A busy print loop polls the status after every page, so parsing is on the hot
+path of the monitor."""
+from __future__ import annotations
+
+from timeit import timeit
+
+from labelprinterkit.backends.simulated import build_status
+from labelprinterkit.constants import ErrorCodes, Media, MediaType, NotificationCodes, PhaseType, StatusCodes, \
+    TapeColor, TextColor
+from labelprinterkit.printers.status import Status
+
+REPEAT = 50000
+
+
+class OldError:
+    def __init__(self, byte1: int, byte2: int) -> None:
+        value = byte1 | (byte2 << 8)
+        self._errors = {err.name: bool(value & err_code) for err_code, err in {x.value: x for x in ErrorCodes}.items()}
+
+    def any(self):
+        return any(self._errors.values())
+
+
+class OldStatus:
+    def __init__(self, data: bytes) -> None:
+        self._data = {
+            "model": data[4],
+            "errors": OldError(data[8], data[9]),
+            "media_width": int(data[10]),
+            "media_type": {x.value: x for x in MediaType}[int(data[11])],
+            "status": {x.value: x for x in StatusCodes}[int(data[18])],
+            "notification": {x.value: x for x in NotificationCodes}[int(data[22])],
+            "tape_color": {x.value: x for x in TapeColor}[int(data[24])],
+            "text_color": {x.value: x for x in TextColor}[int(data[25])],
+        }
+
+    def __getattr__(self, attr):
+        return self._data[attr]
+
+    def ready(self) -> bool:
+        return not self.errors.any()
+
+
+def report(name: str, func) -> None:
+    seconds = timeit(func, number=REPEAT)
+    print(f"{name:<22} {REPEAT / seconds:>10.0f} parses/s {seconds / REPEAT * 1e6:>8.2f} us")
+
+
+def main():
+    data = build_status(Media.W24, StatusCodes.PRINTING_DONE, phase=PhaseType.PRINTING)
+    old, new = OldStatus(data), Status(data)
+    for attr in ("model", "media_width", "media_type", "status", "notification", "tape_color", "text_color"):
+        assert getattr(old, attr) == getattr(new, attr)
+
+    report("parse (previous)", lambda: OldStatus(data))
+    report("parse", lambda: Status(data))
+    report("ready (previous)", lambda: OldStatus(data).ready())
+    report("ready", lambda: Status(data).ready())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""CPU usage and latency of waiting for PRINTING_DONE.
+
+The fake backend replays a sequence of status replies, each becoming readable
+after a delay, and answers nothing in between like a printer that is busy."""
+from __future__ import annotations
+
+from time import monotonic, process_time
+
+from labelprinterkit.backends import BiDirectionalBackend
+from labelprinterkit.constants import StatusCodes
+from labelprinterkit.printers.monitor import StatusMonitor
+
+
+def status(code: StatusCodes) -> bytes:
+    return bytes([0x80, 0x20, 0x42, 0x30] + [0] * 6 + [24, 1] + [0] * 6 + [code.value] + [0] * 13)
+
+
+class ReplayBackend(BiDirectionalBackend):
+    def __init__(self, replies: list[tuple[float, bytes]]) -> None:
+        self._start = monotonic()
+        self._replies = list(replies)
+        self.reads = 0
+
+    def write(self, data: bytes, timeout=None) -> None:
+        pass
+
+    def read(self, count: int, timeout=None) -> bytes | None:
+        self.reads += 1
+        if self._replies and monotonic() - self._start >= self._replies[0][0]:
+            return self._replies.pop(0)[1]
+        return None
+
+    def done_at(self) -> float:
+        return self._start + self._replies[-1][0]
+
+
+def busy_wait(backend: ReplayBackend) -> None:
+    # the loop GenericPrinter.print used before StatusMonitor
+    while True:
+        data = backend.read(32, 1000)
+        while data is None:
+            data = backend.read(32, 1000)
+        if data[18] == StatusCodes.PRINTING_DONE.value:
+            return
+
+
+def measure(name: str, wait, duration: float) -> None:
+    replies = [(duration / 2, status(StatusCodes.PHASE_CHANGE)), (duration, status(StatusCodes.PRINTING_DONE))]
+    backend = ReplayBackend(replies)
+    done_at = backend.done_at()
+    cpu = process_time()
+    wait(backend)
+    latency = monotonic() - done_at
+    cpu = process_time() - cpu
+    print(f"{name:<14} {duration:>5.1f} s page: cpu {cpu / duration:>6.1%}, "
+          f"latency {latency * 1000:>6.1f} ms, {backend.reads:>8} reads")
+
+
+def main():
+    monitor = StatusMonitor()
+    for duration in (0.5, 2.0):
+        measure("busy loop", busy_wait, duration)
+        measure("StatusMonitor", lambda backend: monitor.wait_for_page(backend, 10), duration)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Benchmark suite for the render, encode and transmit hot paths.
+
+Every case is timed with timeit and reported as the best time per call in
+JSON. With a baseline file, every case is compared against the baseline and
+the run fails if a case got slower than the tolerance allows:
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json --update
+
+Timings only compare on the same machine, so refresh the baseline with
+--update when switching machines."""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+from math import ceil
+from timeit import Timer
+from typing import Callable
+
+from labelprinterkit.backends import UniDirectionalBackend
+from labelprinterkit.constants import Media, Resolution
+from labelprinterkit.job import Job
+from labelprinterkit.labels.box import Box
+from labelprinterkit.labels.qrcode import QRCode, _modules, qrcode_render_cache
+from labelprinterkit.labels.text import Text, _solve_font_size
+from labelprinterkit.page import Page
+from labelprinterkit.printers import GenericPrinter, encode_line, encode_page
+from labelprinterkit.utils.font import _load_font
+from labelprinterkit.utils.image import bitmap_to_image, image_to_bitmap
+
+FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+PAGE_LINES = 2000
+REPEAT = 5
+TOLERANCE = 0.25
+
+
+class NullBackend(UniDirectionalBackend):
+    def write(self, data: bytes, timeout=None) -> None:
+        pass
+
+
+def random_bitmap(width: int, lines: int) -> bytes:
+    rng = random.Random(width)
+    # mostly blank and solid bytes, like rendered text
+    return bytes(rng.choice((0x00, 0x00, 0x00, 0xFF, 0x3C)) for _ in range(ceil(width / 8) * lines))
+
+
+def cold(render: Callable, *caches) -> Callable:
+    """Call render with the given lru caches cleared, so every call does the
+    full work instead of a cache lookup"""
+    def case():
+        for cache in caches:
+            cache.cache_clear()
+        return render()
+    return case
+
+
+def render_cases() -> dict[str, Callable]:
+    # time the rendering, not the cache lookups: the render cache is off and
+    # the items are created anew, so they do not keep what they measured
+    qrcode_render_cache.enabled = False
+    text_caches = (_solve_font_size, _load_font)
+    return {
+        "text_render": cold(lambda: Text(70, "Hello World", FONT, cache=False).render(), *text_caches),
+        "qrcode_render": cold(lambda: QRCode(70, "https://example.com/asset/000042").render(), _modules),
+        "box_render": cold(
+            lambda: Box(70, Text(35, "Asset 00042", FONT, cache=False), Text(35, "Room 17", FONT, cache=False),
+                        vertical=True).render(),
+            *text_caches,
+        ),
+    }
+
+
+def raster_cases() -> dict[str, Callable]:
+    width = Media.W24.value.printarea
+    bitmap = random_bitmap(width, PAGE_LINES)
+    image = bitmap_to_image(bitmap, width, PAGE_LINES)
+    return {
+        "image_to_bitmap": lambda: image_to_bitmap(image),
+        "bitmap_to_image": lambda: bitmap_to_image(bitmap, width, PAGE_LINES),
+    }
+
+
+def encode_cases() -> dict[str, Callable]:
+    media = Media.W24.value
+    byte_per_line = ceil(media.printarea / 8)
+    bitmap = random_bitmap(media.printarea, PAGE_LINES)
+    line = bitmap[:byte_per_line]
+    return {
+        "encode_line": lambda: encode_line(line, media.lmargin),
+        "encode_page": lambda: encode_page(bitmap, media.printarea, media.lmargin),
+    }
+
+
+def print_cases() -> dict[str, Callable]:
+    cases = {}
+    for media in Media:
+        width = media.value.printarea
+        if not width:
+            continue
+        bitmap = random_bitmap(width, PAGE_LINES)
+        for resolution in Resolution:
+            job = Job(media, resolution=resolution)
+            job.add_page(Page(bitmap, width, PAGE_LINES, resolution))
+            job.add_page(Page(bitmap, width, PAGE_LINES, resolution))
+            printer = GenericPrinter(NullBackend())
+            cases[f"print_{media.name}_{resolution.name}"] = lambda printer=printer, job=job: printer.print(job)
+    return cases
+
+
+def run(cases: dict[str, Callable], repeat: int = REPEAT) -> dict[str, float]:
+    """Best seconds per call of every case"""
+    results = {}
+    for name, case in cases.items():
+        timer = Timer(case)
+        number, _ = timer.autorange()
+        results[name] = min(timer.repeat(repeat, number)) / number
+    return results
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], tolerance: float) -> list[str]:
+    """Names of the cases slower than the baseline by more than tolerance"""
+    return [
+        name for name, seconds in results.items()
+        if name in baseline and seconds > baseline[name] * (1 + tolerance)
+    ]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the results to this file instead of stdout")
+    parser.add_argument("--baseline", help="compare against this baseline")
+    parser.add_argument("--update", action="store_true", help="store the results as new baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="allowed slowdown against the baseline, as fraction")
+    parser.add_argument("--filter", default="", help="only run cases containing this string")
+    args = parser.parse_args(argv)
+
+    cases = {**render_cases(), **raster_cases(), **encode_cases(), **print_cases()}
+    cases = {name: case for name, case in cases.items() if args.filter in name}
+    results = run(cases)
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+    regressions = []
+    if args.baseline and args.update:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+            file.write("\n")
+    elif args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        report["baseline"] = {name: results[name] / baseline[name] for name in results if name in baseline}
+        regressions = compare(results, baseline, args.tolerance)
+        report["regressions"] = regressions
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+    for name in regressions:
+        print(f"{name} is {report['baseline'][name]:.2f}x slower than the baseline", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""Latency of bursts of small jobs over TCP with and without a ConnectionPool.
+
+The stand-in printer only listens on IPv4 loopback, so every new connection
+to "localhost" first fails over IPv6 like a printer without IPv6 does."""
+from __future__ import annotations
+
+import socketserver
+import threading
+from time import perf_counter
+
+from labelprinterkit.backends.network import ConnectionPool, TCPBackend
+from labelprinterkit.constants import Media
+from labelprinterkit.job import Job
+from labelprinterkit.page import Page
+from labelprinterkit.printers import GenericPrinter
+
+JOBS = 200
+
+
+class DiscardHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        while self.request.recv(65536):
+            pass
+
+
+class Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def small_job() -> Job:
+    media = Media.W12
+    width = media.value.printarea
+    job = Job(media)
+    job.add_page(Page(bytes(9 * 40), width, 40))
+    return job
+
+
+def burst(port: int, pool: ConnectionPool | None) -> float:
+    job = small_job()
+    start = perf_counter()
+    for _ in range(JOBS):
+        backend = TCPBackend("localhost", port, pool=pool)
+        GenericPrinter(backend).print(job)
+        backend.close()
+    return (perf_counter() - start) / JOBS
+
+
+def main():
+    with Server(("127.0.0.1", 0), DiscardHandler) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        port = server.server_address[1]
+        print(f"new connection per job: {burst(port, None) * 1000:.3f} ms/job")
+        pool = ConnectionPool()
+        print(f"pooled connection:      {burst(port, pool) * 1000:.3f} ms/job")
+        pool.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Time per label of building the whole label for every record, compared
+with a LabelTemplate rendering only the slots, once with a serial number and
+QR code slot and once with the serial number slot only. Generating the QR
+code matrix takes most of the time of a label with a changing QR code."""
+from __future__ import annotations
+
+from time import perf_counter
+
+from labelprinterkit.labels.box import Box
+from labelprinterkit.labels.label import Label
+from labelprinterkit.labels.qrcode import QRCode
+from labelprinterkit.labels.template import LabelTemplate, Slot
+from labelprinterkit.labels.text import Padding, Text
+
+LABELS = 500
+FONT = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+def serial(i: int) -> Text:
+    return Text(48, f"SN {i:08d}", FONT, font_size=40)
+
+
+def qrcode(i: int) -> QRCode:
+    return QRCode(128, f"https://example.com/asset/{i:08d}")
+
+
+def layout(serial_item, qrcode_item) -> Box:
+    return Box(128,
+               Box(128, Text(40, "ACME Networks", FONT, padding=Padding(4, 0, 0, 0)),
+                   Text(40, "Datacenter Karlsruhe", FONT, padding=Padding(4, 0, 0, 0)), serial_item, vertical=True),
+               qrcode_item)
+
+
+def per_label(build, first: int) -> float:
+    # every run uses new records, so no rendering is cached from an earlier run
+    start = perf_counter()
+    for i in range(first, first + LABELS):
+        build(i)
+    return (perf_counter() - start) / LABELS
+
+
+def main():
+    static_qrcode = qrcode(0)
+    serial_template = LabelTemplate(layout(Slot("serial", 400, 48, serial), static_qrcode))
+    template = LabelTemplate(layout(Slot("serial", 400, 48, serial), Slot("qrcode", 128, 128, qrcode)))
+    for name, full, templated in (
+        ("serial", lambda i: Label(layout(serial(i), static_qrcode)),
+         lambda i: serial_template.page({"serial": i})),
+        ("serial + qrcode", lambda i: Label(layout(serial(i), qrcode(i))),
+         lambda i: template.page({"serial": i, "qrcode": i})),
+    ):
+        full_time = per_label(full, 0)
+        templated_time = per_label(templated, LABELS)
+        print(f"{name:<16} full label {full_time * 1e6:>7.0f} us, template {templated_time * 1e6:>7.0f} us "
+              f"({full_time / templated_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Count the backend transfers GenericPrinter.print issues per job.
+
+Every transfer to the fake backend costs a fixed overhead, which stands in for
+the per-call cost of a USB bulk transfer or a send() syscall."""
+from __future__ import annotations
+
+import random
+from math import ceil
+from time import perf_counter, sleep
+
+from labelprinterkit.backends import BiDirectionalBackend
+from labelprinterkit.constants import Media
+from labelprinterkit.job import Job
+from labelprinterkit.page import Page
+from labelprinterkit.printers import GenericPrinter
+
+PAGES = 5
+LINES = 1000
+TRANSFER_OVERHEAD = 0.0001
+
+PRINTING_DONE = bytes([0x80, 0x20, 0x42, 0x30] + [0] * 6 + [24, 1] + [0] * 6 + [1] + [0] * 13)
+
+
+class CountingBackend(BiDirectionalBackend):
+    def __init__(self, chunk_size: int | None) -> None:
+        self.write_chunk_size = chunk_size
+        self.transfers = 0
+        self.bytes = 0
+
+    def write(self, data: bytes, timeout=None) -> None:
+        sleep(TRANSFER_OVERHEAD)
+        self.transfers += 1
+        self.bytes += len(data)
+
+    def read(self, count: int, timeout=None) -> bytes:
+        return PRINTING_DONE
+
+
+def build_job() -> Job:
+    media = Media.W24
+    width = media.value.printarea
+    rng = random.Random(0)
+    job = Job(media)
+    for _ in range(PAGES):
+        bitmap = bytes(rng.choice((0x00, 0xFF, 0x3C)) for _ in range(ceil(width / 8) * LINES))
+        job.add_page(Page(bitmap, width, LINES))
+    return job
+
+
+def main():
+    job = build_job()
+    # one transfer per raster line plus the mode commands of every page
+    legacy = 2 + PAGES * (LINES + 10) + 1
+    print(f"unbuffered (one transfer per command): {legacy} transfers")
+    for chunk_size in (None, 16384, 4096, 512, 64):
+        backend = CountingBackend(chunk_size)
+        start = perf_counter()
+        GenericPrinter(backend).print(job)
+        elapsed = perf_counter() - start
+        print(
+            f"chunk size {str(chunk_size):>5}: {backend.transfers:>6} transfers, "
+            f"{backend.bytes} bytes, {elapsed * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
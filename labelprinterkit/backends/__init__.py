@@ -4,12 +4,14 @@ from abc import ABC, abstractmethod
 
 
 class BaseBackend(ABC):
-    ...
+    # Largest amount of data to hand to a single write call, None if the
+    # transport takes writes of any size.
+    write_chunk_size: int | None = None
 
 
 class UniDirectionalBackend(BaseBackend):
     @abstractmethod
-    def write(self, data: bytes): ...
+    def write(self, data: bytes, timeout=None): ...
 
 
 class BiDirectionalBackend(UniDirectionalBackend):
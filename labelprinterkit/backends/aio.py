@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from abc import ABC, abstractmethod
+
+try:
+    import serial
+except ImportError:
+    serial = None
+
+
+class AsyncBackend(ABC):
+    """Backend for use with asyncio. Reads return None if the printer did not
+    answer within timeout milliseconds."""
+
+    # Largest amount of data to hand to a single write call, None if the
+    # transport takes writes of any size.
+    write_chunk_size: int | None = None
+
+    @abstractmethod
+    async def write(self, data: bytes, timeout=None): ...
+
+    async def read(self, count: int, timeout=None) -> bytes | None:
+        raise RuntimeError("Backend is unidirectional")
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+
+class AsyncTCPBackend(AsyncBackend):
+    """Raw TCP connection to port 9100 of a network printer using asyncio streams"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    @classmethod
+    async def connect(cls, host, port=9100, timeout=10) -> AsyncTCPBackend:
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"Connection to {host} failed.") from e
+        return cls(reader, writer)
+
+    async def write(self, data: bytes, timeout=None) -> None:
+        if self._writer.is_closing():
+            raise IOError("Socket connection broken")
+        self._writer.write(data)
+        await self._writer.drain()
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+class AsyncSerialBackend(AsyncBackend):
+    """Bluetooth serial connection driven through the event loop with a
+    non-blocking file descriptor (POSIX only)"""
+
+    def __init__(self, dev_path: str) -> None:
+        if serial is None:
+            raise RuntimeError(
+                "Bluetooth is not supported. Pacakge serial is missing.")
+        dev = serial.Serial(dev_path, baudrate=9600, stopbits=serial.STOPBITS_ONE,
+                            parity=serial.PARITY_NONE, bytesize=8, dsrdtr=False, timeout=0)
+        if dev is None:
+            raise OSError("Device not found")
+        self._dev = dev
+        self._fd = dev.fileno()
+        os.set_blocking(self._fd, False)
+
+    async def _wait(self, readable: bool, timeout: float | None = None) -> bool:
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+
+        def callback():
+            if not ready.done():
+                ready.set_result(None)
+
+        if readable:
+            loop.add_reader(self._fd, callback)
+        else:
+            loop.add_writer(self._fd, callback)
+        try:
+            await asyncio.wait_for(ready, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if readable:
+                loop.remove_reader(self._fd)
+            else:
+                loop.remove_writer(self._fd)
+
+    async def write(self, data: bytes, timeout=None) -> None:
+        view = memoryview(data)
+        while view:
+            try:
+                written = os.write(self._fd, view)
+            except BlockingIOError:
+                written = 0
+            if written:
+                view = view[written:]
+            else:
+                await self._wait(readable=False)
+
+    async def read(self, count: int, timeout=None) -> bytes | None:
+        data = b""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout / 1000
+        while len(data) < count:
+            try:
+                chunk = os.read(self._fd, count - len(data))
+            except BlockingIOError:
+                chunk = b""
+            if chunk:
+                data += chunk
+                continue
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                break
+            if not await self._wait(readable=True, timeout=remaining):
+                break
+        return data or None
+
+    async def close(self) -> None:
+        self._dev.close()
+
+
+class AsyncUSBBackend(AsyncBackend):
+    """Runs the blocking calls of a PyUSBBackend in an executor"""
+
+    def __init__(self, backend, executor=None) -> None:
+        self._backend = backend
+        self._executor = executor
+
+    @property
+    def write_chunk_size(self) -> int | None:
+        return self._backend.write_chunk_size
+
+    async def write(self, data: bytes, timeout: int = 1000) -> None:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._backend.write, data, timeout)
+
+    async def read(self, count: int, timeout=None) -> bytes | None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._backend.read, count, timeout)
@@ -19,7 +19,7 @@ class BTSerialBackend(BiDirectionalBackend):
             raise OSError("Device not found")
         self._dev = dev
 
-    def write(self, data: bytes):
+    def write(self, data: bytes, timeout=None):
         self._dev.write(data)
 
     def read(self, count: int, timeout=None) -> bytes:
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from . import BaseBackend, UniDirectionalBackend
+
+
+class BufferedBackend(UniDirectionalBackend):
+    """Collects writes in memory and hands them to the wrapped backend in as
+    few transfers as possible when flushed.
+
+    The buffer is sent in chunks of chunk_size bytes, which defaults to the
+    write_chunk_size of the wrapped backend. If max_buffer is set, the buffer
+    is flushed as soon as it holds more than max_buffer bytes."""
+
+    def __init__(self, backend: BaseBackend, chunk_size: int | None = None, max_buffer: int | None = None) -> None:
+        self._backend = backend
+        if chunk_size is None:
+            chunk_size = backend.write_chunk_size
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size has to be positive: {chunk_size}")
+        self.write_chunk_size = chunk_size
+        self.max_buffer = max_buffer
+        self._buffer = bytearray()
+        self._timeout = None
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __enter__(self) -> BufferedBackend:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self._buffer.clear()
+
+    def write(self, data: bytes, timeout=None) -> None:
+        self._buffer += data
+        if timeout is not None:
+            self._timeout = timeout
+        if self.max_buffer is not None and len(self._buffer) > self.max_buffer:
+            self.flush()
+
+    def read(self, count: int, timeout=None) -> bytes | None:
+        self.flush()
+        return self._backend.read(count, timeout)
+
+    def flush(self) -> None:
+        if not self._buffer:
+            return
+        data = memoryview(self._buffer)
+        chunk_size = self.write_chunk_size or len(data)
+        try:
+            for i in range(0, len(data), chunk_size):
+                chunk = bytes(data[i : i + chunk_size])
+                if self._timeout is None:
+                    self._backend.write(chunk)
+                else:
+                    self._backend.write(chunk, timeout=self._timeout)
+        finally:
+            data.release()
+            self._buffer.clear()
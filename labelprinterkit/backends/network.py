@@ -1,5 +1,8 @@
 from __future__ import annotations
+import select
 import socket
+import threading
+from time import monotonic
 
 try:
     from pysnmp.hlapi import SnmpEngine, getCmd, UdpTransportTarget, Udp6TransportTarget,\
@@ -17,56 +20,252 @@ except ImportError:
 from . import UniDirectionalBackend
 
 
-class TCPBackend(UniDirectionalBackend):
-    def __init__(self, host, port=9100, timeout=10):
-        self._timeout = timeout
-        sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
+def _connect(host, port, timeout, families=(socket.AF_INET6, socket.AF_INET)) -> socket.socket:
+    for family in families:
+        sock = socket.socket(family, socket.SOCK_STREAM)
         sock.settimeout(timeout)
         try:
             sock.connect((host, port))
-        except (socket.gaierror, ConnectionError):
+        except (socket.gaierror, OSError):
             sock.close()
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
+            continue
+        return sock
+    raise ConnectionError(f"Connection to {host} failed.")
+
+
+class ConnectionPool:
+    """Keeps TCP connections to printers open between jobs.
+
+    Connections are keyed by (host, port). The address family that worked for
+    a host is remembered, so later connections skip the failing IPv6 attempt.
+    Connections idle for longer than max_idle seconds are closed and at most
+    max_idle_per_host idle connections are kept per host."""
+
+    def __init__(self, max_idle: float = 60.0, max_idle_per_host: int = 2) -> None:
+        self.max_idle = max_idle
+        self.max_idle_per_host = max_idle_per_host
+        self._lock = threading.Lock()
+        self._idle: dict[tuple, list[tuple[socket.socket, float]]] = {}
+        self._families: dict[tuple, int] = {}
+
+    def acquire(self, host, port, timeout) -> tuple[socket.socket, bool]:
+        """Get a connection to host and port. The flag tells whether the
+        connection was reused from the pool."""
+        key = (host, port)
+        self.evict_idle()
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                sock, _ = idle.pop()
+                if self._is_alive(sock):
+                    sock.settimeout(timeout)
+                    return sock, True
+                sock.close()
+            family = self._families.get(key)
+        if family is not None:
+            try:
+                sock = _connect(host, port, timeout, (family,))
+            except ConnectionError:
+                sock = _connect(host, port, timeout)
+        else:
+            sock = _connect(host, port, timeout)
+        with self._lock:
+            self._families[key] = sock.family
+        return sock, False
+
+    def release(self, host, port, sock: socket.socket) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((host, port), [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append((sock, monotonic()))
+                return
+        sock.close()
+
+    def evict_idle(self) -> None:
+        deadline = monotonic() - self.max_idle
+        with self._lock:
+            for key, idle in self._idle.items():
+                expired = [sock for sock, released in idle if released < deadline]
+                idle[:] = [(sock, released) for sock, released in idle if released >= deadline]
+                for sock in expired:
+                    sock.close()
+
+    def close(self) -> None:
+        with self._lock:
+            for idle in self._idle.values():
+                for sock, _ in idle:
+                    sock.close()
+            self._idle.clear()
+
+    @staticmethod
+    def _is_alive(sock: socket.socket) -> bool:
+        # An idle printer connection has nothing to read. If it is readable,
+        # the printer closed it or sent data we do not expect.
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+
+class TCPBackend(UniDirectionalBackend):
+    """Raw TCP connection to port 9100 of a network printer.
+
+    With a pool, the connection is taken from and returned to the pool on
+    close, and a pooled connection that turns out to be broken is replaced
+    transparently."""
+
+    def __init__(self, host, port=9100, timeout=10, pool: ConnectionPool | None = None):
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._pool = pool
+        if pool is None:
+            self._sock = _connect(host, port, timeout)
+            self._reused = False
+        else:
+            self._sock, self._reused = pool.acquire(host, port, timeout)
+
+    @property
+    def write_chunk_size(self) -> int:
+        return self._sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)
+
+    def write(self, data: bytes, timeout=None) -> None:
+        view = memoryview(data)
+        while view:
             try:
-                sock.connect((host, port))
-            except (socket.gaierror, ConnectionError):
-                raise ConnectionError(f"Connection to {host} failed.")
-        self._sock = sock
+                sent = self._sock.send(view)
+            except ConnectionError as e:
+                if not self._can_reconnect(view, data):
+                    raise IOError("Socket connection broken") from e
+                sent = 0
+            except OSError as e:
+                raise IOError("Socket connection broken") from e
+            if sent == 0:
+                # A reused connection may have been closed by the printer in
+                # the meantime. Reconnect if nothing was sent over it yet.
+                if not self._can_reconnect(view, data):
+                    raise IOError("Socket connection broken")
+                self._sock.close()
+                self._sock, self._reused = self._pool.acquire(self._host, self._port, self._timeout)
+                continue
+            view = view[sent:]
+        self._reused = False
+
+    def _can_reconnect(self, view: memoryview, data: bytes) -> bool:
+        return self._reused and len(view) == len(data)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.release(self._host, self._port, self._sock)
+        else:
+            self._sock.close()
+
+    def __enter__(self):
+        return self
 
-    def write(self, data: bytes) -> None:
-        sent = self._sock.send(data)
-        if sent == 0:
-            raise IOError("Socket connection broken")
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._sock.close()
 
 
 class NetworkBackend(TCPBackend):
-    def __init__(self, host, port=9100, timeout=10, snmp_community='public', snmp_port=161):
+    """TCP backend which reads the printer status over SNMP.
+
+    The SNMP engine, credentials and transport are created once and reused for
+    every status request. With status_ttl set, a status younger than
+    status_ttl seconds is answered from memory; start_status_polling keeps it
+    fresh from a background thread."""
+
+    STATUS_OID = '.1.3.6.1.4.1.2435.3.3.9.1.6.1.0'
+
+    def __init__(self, host, port=9100, timeout=10, snmp_community='public', snmp_port=161,
+                 pool: ConnectionPool | None = None, status_ttl: float | None = None):
         if getCmd is None:
             raise RuntimeError('Bidirectional network communication is not supported. Pacakge pysnmp is missing.')
         self._snmp_community = snmp_community
         self._snmp_port = snmp_port
-        super().__init__(host, port, timeout)
+        self._status_ttl = status_ttl
+        self._snmp_lock = threading.Lock()
+        self._snmp = None
+        self._transport = None
+        self._transport_address = None
+        self._status: tuple[bytes | None, float] | None = None
+        self._poller: threading.Thread | None = None
+        self._stop_polling = threading.Event()
+        super().__init__(host, port, timeout, pool)
 
     def get_status(self):
-        remote_address = self._sock.getpeername()[0]
+        status = self._status
+        if status is not None and self._status_ttl is not None and monotonic() - status[1] < self._status_ttl:
+            return status[0]
+        return self._fetch_status()
 
-        if self._sock.family == socket.AF_INET6:
-            transport = Udp6TransportTarget((remote_address, 161), timeout=self._timeout)
-        else:
-            transport = UdpTransportTarget((remote_address, 161), timeout=self._timeout)
-
-        iterator = getCmd(
-            SnmpEngine(),
-            CommunityData('public'),
-            transport,
-            ContextData(),
-            ObjectType(ObjectIdentity('.1.3.6.1.4.1.2435.3.3.9.1.6.1.0'))
+    def start_status_polling(self, interval: float = 1.0) -> None:
+        """Fetch the status every interval seconds in a background thread"""
+        if self._poller is not None:
+            return
+        if self._status_ttl is None:
+            self._status_ttl = interval * 2
+        self._stop_polling.clear()
+        self._poller = threading.Thread(target=self._poll_status, args=(interval,), daemon=True,
+                                        name=f"NetworkBackend-status-{self._host}")
+        self._poller.start()
+
+    def stop_status_polling(self) -> None:
+        if self._poller is None:
+            return
+        self._stop_polling.set()
+        self._poller.join()
+        self._poller = None
+
+    def close(self) -> None:
+        self.stop_status_polling()
+        super().close()
+
+    def _poll_status(self, interval: float) -> None:
+        while True:
+            try:
+                self._fetch_status()
+            except OSError:
+                self._status = (None, monotonic())
+            if self._stop_polling.wait(interval):
+                return
+
+    def _fetch_status(self):
+        with self._snmp_lock:
+            engine, auth, context, status_object = self._snmp_session()
+            iterator = getCmd(engine, auth, self._snmp_transport(), context, status_object)
+
+            error_indication, _, _, variables = next(iterator)
+            if error_indication:
+                status_data = None
+            else:
+                status_data = bytes(variables[0][1])
+        self._status = (status_data, monotonic())
+        return status_data
+
+    def _snmp_session(self):
+        if self._snmp is None:
+            self._snmp = (
+                SnmpEngine(),
+                CommunityData(self._snmp_community),
+                ContextData(),
+                ObjectType(ObjectIdentity(self.STATUS_OID)),
             )
+        return self._snmp
 
-        error_indication, _, _, variables = next(iterator)
-        if error_indication:
-            return None
-        else:
-            status_data = bytes(variables[0][1])
-            return status_data
+    def _snmp_transport(self):
+        # the connection may have been replaced by the pool, so the transport
+        # is only reused as long as the peer stays the same
+        address = (self._sock.family, self._sock.getpeername()[0])
+        if self._transport is None or self._transport_address != address:
+            if self._sock.family == socket.AF_INET6:
+                transport = Udp6TransportTarget((address[1], self._snmp_port), timeout=self._timeout)
+            else:
+                transport = UdpTransportTarget((address[1], self._snmp_port), timeout=self._timeout)
+            self._transport = transport
+            self._transport_address = address
+        return self._transport
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import socketserver
+import threading
+from logging import getLogger
+from math import ceil
+from time import monotonic, sleep
+
+import packbits
+
+from . import BiDirectionalBackend
+from ..constants import AdvancedModeSettings, ErrorCodes, Media, PhaseType, Resolution, StatusCodes, TapeColor, \
+    TextColor, VariousModesSettings
+from ..page import Page
+
+logger = getLogger(__name__)
+
+def build_status(
+    media: Media,
+    status: StatusCodes = StatusCodes.STATUS_REPLY,
+    errors: int = 0,
+    phase: PhaseType = PhaseType.EDITING,
+    model: int = 0x68,
+    tape_color: TapeColor = TapeColor.WHITE,
+    text_color: TextColor = TextColor.BLACK,
+) -> bytes:
+    """Build a 32 byte status reply as sent by the printer"""
+    media_type = media.value.media_type.value if media.value.media_type is not None else 0
+    data = bytearray(32)
+    data[0] = 0x80  # Print head mark
+    data[1] = 0x20  # Size
+    data[2] = 0x42  # Brother code
+    data[3] = 0x30  # Series code
+    data[4] = model
+    data[5] = 0x30  # Country code
+    data[8] = errors & 0xFF
+    data[9] = errors >> 8
+    data[10] = media.value.width
+    data[11] = media_type
+    data[18] = status.value
+    data[19] = phase.value
+    data[24] = tape_color.value if media_type else TapeColor.NO_MEDIA.value
+    data[25] = text_color.value if media_type else TextColor.NO_MEDIA.value
+    return bytes(data)
+
+
+class SimulatedBackend(BiDirectionalBackend):
+    """Stand-in for a printer, decoding the raster command stream into pages.
+
+    The pages printed are collected in pages. Every Z command is decoded as
+    the blank raster line it stands for, so a page sent by GenericPrinter
+    comes back one line longer than it was. Printing a page takes as long as
+    a print head moving lines_per_second raster lines per second needs, plus
+    cut_time seconds when the page is cut. Status replies follow the printer:
+    a reply to every status request, a phase change when printing starts and
+    PRINTING_DONE once a page left the printer. With error set, every page
+    fails with ERROR_OCCURRED and the given error bits instead. A page printed
+    for a media other than the loaded one fails with REPLACE_MEDIA."""
+
+    def __init__(
+        self,
+        media: Media = Media.W12,
+        lines_per_second: float | None = None,
+        cut_time: float = 0.0,
+        error: ErrorCodes | None = None,
+    ) -> None:
+        self.media = media
+        self.lines_per_second = lines_per_second
+        self.cut_time = cut_time
+        self.error = error
+        self.pages: list[Page] = []
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+        self._buffer = bytearray()
+        self._replies: list[tuple[float, bytes]] = []
+        self._busy_until = 0.0
+        self._reset()
+
+    def _reset(self) -> None:
+        self._job_media: Media | None = None
+        self._auto_cut = False
+        self._resolution = Resolution.LOW
+        self._margin = 0
+        self._compression = False
+        self._lines = bytearray()
+        self._line_count = 0
+
+    def write(self, data: bytes, timeout=None) -> None:
+        with self._lock:
+            self.bytes_received += len(data)
+            self._buffer += data
+            consumed = self._parse()
+            del self._buffer[:consumed]
+
+    def read(self, count: int, timeout=None) -> bytes | None:
+        """Return the next status reply. Waits up to timeout milliseconds for
+        a reply that is not due yet."""
+        with self._lock:
+            due = self._replies[0][0] if self._replies else None
+        now = monotonic()
+        if due is None or due > now:
+            if timeout is None:
+                return None
+            wait = timeout / 1000
+            if due is not None and due - now <= wait:
+                sleep(due - now)
+            else:
+                sleep(wait)
+                return None
+        with self._lock:
+            return self._replies.pop(0)[1][:count]
+
+    @property
+    def idle_at(self) -> float:
+        """monotonic time when the last page received is printed"""
+        return self._busy_until
+
+    def _reply(self, at: float, status: StatusCodes, errors: int = 0, phase: PhaseType = PhaseType.EDITING) -> None:
+        self._replies.append((at, build_status(self.media, status, errors, phase)))
+        self._replies.sort(key=lambda reply: reply[0])
+
+    def _parse(self) -> int:
+        data = self._buffer
+        pos = 0
+        while pos < len(data):
+            command = data[pos]
+            if command == 0x00:  # Invalidate
+                pos += 1
+            elif command == 0x1B:
+                if pos + 1 >= len(data):
+                    break
+                if data[pos + 1] == 0x40:  # Initialize
+                    self._reset()
+                    pos += 2
+                    continue
+                if pos + 2 >= len(data):
+                    break
+                if data[pos + 1] != 0x69:
+                    raise IOError(f"Unknown command {bytes(data[pos:pos + 3])}")
+                length = self._argument_length(data, pos)
+                if length is None:
+                    break
+                self._escape(bytes(data[pos + 2 : pos + 3 + length]))
+                pos += 3 + length
+            elif command == ord("M"):
+                if pos + 1 >= len(data):
+                    break
+                self._compression = data[pos + 1] == 0x02
+                pos += 2
+            elif command in (ord("G"), ord("g")):
+                if pos + 3 > len(data):
+                    break
+                length = data[pos + 1] | data[pos + 2] << 8
+                if pos + 3 + length > len(data):
+                    break
+                self._raster(bytes(data[pos + 3 : pos + 3 + length]))
+                pos += 3 + length
+            elif command == ord("Z"):  # Zero raster graphics
+                self._raster(b"")
+                pos += 1
+            elif command in (0x0C, 0x1A):  # Print, print with feeding
+                self._print(last=command == 0x1A)
+                pos += 1
+            else:
+                raise IOError(f"Unknown command {bytes(data[pos:pos + 1])}")
+        return pos
+
+    @staticmethod
+    def _argument_length(data: bytearray, pos: int) -> int | None:
+        command = chr(data[pos + 2])
+        if command == "z":
+            # The print information command has 10 arguments, but is sent
+            # with 9 by GenericPrinter. Accept both.
+            if pos + 12 < len(data) and data[pos + 12] != 0x1B:
+                return 10
+            if pos + 12 <= len(data):
+                return 9
+            return None
+        lengths = {"S": 0, "a": 1, "M": 1, "K": 1, "A": 1, "d": 2, "!": 1, "U": 2}
+        if command not in lengths:
+            raise IOError(f"Unknown command {bytes(data[pos:pos + 3])}")
+        if pos + 3 + lengths[command] > len(data):
+            return None
+        return lengths[command]
+
+    def _escape(self, command: bytes) -> None:
+        name, arguments = chr(command[0]), command[1:]
+        if name == "S":
+            self._reply(monotonic(), StatusCodes.STATUS_REPLY)
+        elif name == "z":
+            self._job_media = Media.get_media(arguments[2], self._media_type(arguments[1]))
+        elif name == "M":
+            self._auto_cut = bool(arguments[0] & VariousModesSettings.AUTO_CUT.value)
+        elif name == "K":
+            high = arguments[0] & AdvancedModeSettings.HIGH_RESOLUTION.value
+            self._resolution = Resolution.HIGH if high else Resolution.LOW
+
+    @staticmethod
+    def _media_type(value: int):
+        for media in Media:
+            if media.value.media_type is not None and media.value.media_type.value == value:
+                return media.value.media_type
+        return None
+
+    def _raster(self, line: bytes) -> None:
+        media = self._job_media or self.media
+        width = media.value.printarea or 0
+        if line and self._compression:
+            line = packbits.decode(line)
+        line_int = int.from_bytes(line.ljust(16, b"\x00"), byteorder="big") if line else 0
+        byte_per_line = ceil(width / 8)
+        line_int >>= media.value.lmargin or 0
+        line_int &= (1 << (byte_per_line * 8)) - 1
+        self._lines += line_int.to_bytes(byte_per_line, byteorder="big")
+        self._line_count += 1
+
+    def _print(self, last: bool) -> None:
+        media = self._job_media or self.media
+        now = monotonic()
+        start = max(now, self._busy_until)
+        if self.error is not None or media != self.media:
+            errors = self.error.value if self.error is not None else ErrorCodes.REPLACE_MEDIA.value
+            self._reply(start, StatusCodes.ERROR_OCCURRED, errors)
+        else:
+            page = Page(bytes(self._lines), media.value.printarea, self._line_count, self._resolution)
+            self.pages.append(page)
+            duration = self._line_count / self.lines_per_second if self.lines_per_second else 0.0
+            if self._auto_cut:
+                duration += self.cut_time
+            self._busy_until = start + duration
+            self._reply(start, StatusCodes.PHASE_CHANGE, phase=PhaseType.PRINTING)
+            self._reply(self._busy_until, StatusCodes.PRINTING_DONE, phase=PhaseType.PRINTING)
+            self._reply(self._busy_until, StatusCodes.PHASE_CHANGE, phase=PhaseType.EDITING)
+        logger.debug("simulated page with %s lines, last: %s", self._line_count, last)
+        self._lines = bytearray()
+        self._line_count = 0
+
+
+class _SimulatedPrinterHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        backend = self.server.backend
+        # the printer takes one connection at a time, like the real device
+        with self.server.connection_lock:
+            while True:
+                data = self.request.recv(65536)
+                if not data:
+                    return
+                backend.write(data)
+
+
+class SimulatedPrinterServer(socketserver.ThreadingTCPServer):
+    """Stand-in for the raw TCP port 9100 of a network printer, feeding all
+    connections into a SimulatedBackend.
+
+    Port 0 picks a free port, see address for the one actually used."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, backend: SimulatedBackend | None = None) -> None:
+        super().__init__((host, port), _SimulatedPrinterHandler)
+        self.backend = backend if backend is not None else SimulatedBackend()
+        self.connection_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self.server_address[:2]
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True, name="SimulatedPrinterServer")
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> SimulatedPrinterServer:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
@@ -9,6 +9,10 @@ import libusb_package
 from .. import BrotherPrinterError
 from . import BaseBackend
 
+# Upper bound for a single bulk transfer, rounded down to a multiple of the
+# max packet size of the endpoint.
+USB_TRANSFER_SIZE = 16384
+
 
 class PyUSBBackend(BaseBackend):
     """Assumes only a SINGLE USB Printer / Brother Device is Attached"""
@@ -83,14 +87,30 @@ class PyUSBBackend(BaseBackend):
 
         self.refresh()
 
+    @property
+    def write_chunk_size(self) -> int:
+        """Largest multiple of the max packet size of endpoint 0x2 within USB_TRANSFER_SIZE"""
+        try:
+            interface = self._dev.get_active_configuration()[(0, 0)]
+            endpoint = usb.util.find_descriptor(interface, bEndpointAddress=0x2)
+        except usb.core.USBError:
+            endpoint = None
+        packet_size = endpoint.wMaxPacketSize if endpoint is not None else 64
+        return USB_TRANSFER_SIZE // packet_size * packet_size
+
     def write(self, data: bytes, timeout: int = 1000) -> None:
         """Timeout - Default PyUSB Read Timeout is 1000ms=1s"""
         self._dev.write(endpoint=0x2, data=data, timeout=timeout)
 
     def read(self, count: int, timeout=None) -> bytes | None:
+        """Returns None if the printer did not answer, PyUSB raises on a read
+        timeout instead of returning no data."""
         for _ in range(0, 3):
-            data = self._dev.read(
-                endpoint=0x81, size_or_buffer=count, timeout=timeout)
+            try:
+                data = self._dev.read(
+                    endpoint=0x81, size_or_buffer=count, timeout=timeout)
+            except usb.core.USBTimeoutError:
+                data = None
             if data:
                 return data
             sleep(0.1)
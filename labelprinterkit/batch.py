@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Union
+
+from .constants import Resolution
+from .labels import Item
+from .labels.label import Label
+from .page import BasePage, Page
+
+Template = Callable[[Any], Union[Item, BasePage]]
+
+
+def _render_batch(template: Template, records: list, resolution: Resolution) -> list[tuple]:
+    rendered = []
+    for record in records:
+        page = template(record)
+        if isinstance(page, Item):
+            page = Label(page, resolution)
+        # only the raster goes back to the parent process, no PIL objects
+        rendered.append((bytes(page.bitmap), page.width, page.length, page.resolution))
+    return rendered
+
+
+def render_pages(
+    template: Template,
+    records: Iterable,
+    workers: int | None = None,
+    batch_size: int = 32,
+    resolution: Resolution = Resolution.LOW,
+) -> Iterator[Page]:
+    """Render a page for every record in a pool of worker processes.
+
+    template is called with a record and returns an Item, which is rendered as
+    a Label at resolution, or a page. It has to be picklable, e.g. a module
+    level function. The pages are yielded in the order of the records. Records
+    are read lazily and at most two batches per worker are in flight at any
+    time."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    records = iter(records)
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < 2 * workers:
+                batch = list(islice(records, batch_size))
+                if not batch:
+                    break
+                pending.append(executor.submit(_render_batch, template, batch, resolution))
+            if not pending:
+                return
+            for bitmap, width, length, page_resolution in pending.popleft().result():
+                yield Page(bitmap, width, length, page_resolution)
@@ -84,6 +84,11 @@ class StatusCodes(Enum):
     PHASE_CHANGE = 0x06
 
 
+class PhaseType(Enum):
+    EDITING = 0x00
+    PRINTING = 0x01
+
+
 class NotificationCodes(Enum):
     NOT_AVAILABLE = 0x00
     COVER_OPEN = 0x01
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import CancelledError, Future
+from logging import getLogger
+from time import monotonic
+from typing import NamedTuple
+
+from .backends.main import Backend
+from .constants import Media
+from .job import Job
+from .printers import GenericPrinter
+from .printers.main import Printer
+from .printers.status import Status
+
+logger = getLogger(__name__)
+
+
+class _QueuedJob(NamedTuple):
+    job: Job
+    future: Future
+    attempt: int
+
+
+class FarmDevice:
+    """A printer of a PrintFarm with its own job queue and worker thread"""
+
+    def __init__(self, name: str, printer: GenericPrinter, media: Media | None = None) -> None:
+        self.name = name
+        self.printer = printer
+        self.status: Status | None = None
+        self.healthy = True
+        self.busy = False
+        self.jobs_done = 0
+        self.failures = 0
+        self.refreshed = 0.0
+        self._media = media
+        self._queue: deque[_QueuedJob] = deque()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def media(self) -> Media | None:
+        """Loaded media as reported by the printer, None if unknown"""
+        if self._media is not None:
+            return self._media
+        if self.status is not None:
+            return self.status.media
+        return None
+
+    @property
+    def load(self) -> int:
+        return len(self._queue) + self.busy
+
+    def accepts(self, job: Job) -> bool:
+        return self.healthy and self.media == job.media
+
+    def refresh_status(self) -> None:
+        self.refreshed = monotonic()
+        try:
+            self.status = self.printer.get_status()
+        except (IOError, RuntimeError) as e:
+            logger.debug("status of %s not available: %s", self.name, e)
+            self.status = None
+            # without a status only a fixed media makes the printer usable
+            self.healthy = self._media is not None
+            return
+        self.healthy = self.status.ready()
+
+    def __repr__(self) -> str:
+        return f"<FarmDevice {self.name} media={self.media} load={self.load} healthy={self.healthy}>"
+
+
+class FarmStats(NamedTuple):
+    jobs_done: int
+    jobs_failed: int
+    pending: int
+    queue_depth: dict[str, int]
+    throughput: float  # jobs per second since start
+
+
+class PrintFarm:
+    """Distributes jobs over a pool of printers.
+
+    Every job is routed to a healthy printer with the media of the job loaded,
+    preferring the printer with the least queued jobs. Each printer works
+    through its own queue in a worker thread. Jobs that no printer can take
+    right now stay pending until a matching printer becomes available.
+
+    max_queue bounds the number of jobs queued on a single printer and
+    status_interval is the time in seconds between two status polls of an
+    idle printer. A job is retried on another printer up to max_attempts
+    times before its future fails."""
+
+    def __init__(self, max_queue: int = 1, status_interval: float = 5.0, max_attempts: int = 2) -> None:
+        if max_queue < 1:
+            raise ValueError(f"max_queue has to be at least 1: {max_queue}")
+        self.max_queue = max_queue
+        self.status_interval = status_interval
+        self.max_attempts = max_attempts
+        self._devices: dict[str, FarmDevice] = {}
+        self._pending: deque[_QueuedJob] = deque()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._running = False
+        self._started: float | None = None
+        self._jobs_done = 0
+        self._jobs_failed = 0
+
+    @property
+    def devices(self) -> list[FarmDevice]:
+        return list(self._devices.values())
+
+    def add_printer(self, printer: GenericPrinter, name: str | None = None, media: Media | None = None) -> FarmDevice:
+        """Add a printer to the farm. If media is given, it overrides the media
+        reported by the printer, which is needed for unidirectional backends."""
+        if name is None:
+            name = f"{type(printer).__name__}-{len(self._devices)}"
+        if name in self._devices:
+            raise ValueError(f"Printer with name {name} already exists")
+        device = FarmDevice(name, printer, media)
+        device.refresh_status()
+        with self._lock:
+            self._devices[name] = device
+            if self._running:
+                self._start_worker(device)
+            self._dispatch()
+        return device
+
+    def add(self, printer: Printer, backend: Backend, *args, name: str | None = None, media: Media | None = None,
+            **kwargs) -> FarmDevice:
+        """Create a printer from the Printer and Backend enums and add it to the farm"""
+        return self.add_printer(printer.printer(backend.backend(*args, **kwargs)), name, media)
+
+    def submit(self, job: Job) -> Future:
+        future = Future()
+        with self._lock:
+            self._pending.append(_QueuedJob(job, future, 1))
+            self._dispatch()
+        return future
+
+    def start(self) -> None:
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._started = monotonic()
+            for device in self._devices.values():
+                self._start_worker(device)
+
+    def stop(self, wait: bool = True) -> None:
+        """Stop the workers. Jobs already queued on a printer are finished first,
+        without a retry if they fail. The futures of jobs still pending, e.g.
+        because no printer with their media was available, are cancelled."""
+        with self._lock:
+            self._running = False
+            pending, self._pending = self._pending, deque()
+            self._changed.notify_all()
+            threads = [device._thread for device in self._devices.values() if device._thread is not None]
+        # done callbacks may call back into the farm, so futures are only
+        # resolved without the lock held
+        for queued in pending:
+            queued.future.cancel()
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    def __enter__(self) -> PrintFarm:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def stats(self) -> FarmStats:
+        with self._lock:
+            elapsed = monotonic() - self._started if self._started is not None else 0
+            return FarmStats(
+                self._jobs_done,
+                self._jobs_failed,
+                len(self._pending),
+                {name: device.load for name, device in self._devices.items()},
+                self._jobs_done / elapsed if elapsed else 0.0,
+            )
+
+    def _start_worker(self, device: FarmDevice) -> None:
+        device._thread = threading.Thread(target=self._work, args=(device,), name=f"PrintFarm-{device.name}",
+                                          daemon=True)
+        device._thread.start()
+
+    def _dispatch(self) -> None:
+        # has to be called with the lock held
+        waiting = deque()
+        while self._pending:
+            queued = self._pending.popleft()
+            if queued.future.cancelled():
+                continue
+            candidates = [
+                device for device in self._devices.values()
+                if device.accepts(queued.job) and len(device._queue) < self.max_queue
+            ]
+            if not candidates:
+                waiting.append(queued)
+                continue
+            device = min(candidates, key=lambda candidate: candidate.load)
+            device._queue.append(queued)
+        self._pending = waiting
+        self._changed.notify_all()
+
+    def _work(self, device: FarmDevice) -> None:
+        while True:
+            with self._lock:
+                while not device._queue:
+                    if not self._running:
+                        return
+                    idle = monotonic() - device.refreshed
+                    if idle >= self.status_interval:
+                        break
+                    self._changed.wait(self.status_interval - idle)
+                queued = device._queue.popleft() if device._queue else None
+                device.busy = queued is not None
+
+            if queued is None:
+                device.refresh_status()
+                with self._lock:
+                    self._dispatch()
+                continue
+
+            if not queued.future.set_running_or_notify_cancel():
+                with self._lock:
+                    device.busy = False
+                continue
+            try:
+                device.printer.print(queued.job)
+            except Exception as e:
+                logger.warning("printing on %s failed: %s", device.name, e)
+                device.failures += 1
+                device.healthy = False
+                with self._lock:
+                    device.busy = False
+                    retried = queued.attempt < self.max_attempts and self._running
+                    if retried:
+                        # set_running_or_notify_cancel can only be called once per future
+                        retry = Future()
+                        retry.add_done_callback(lambda done, future=queued.future: _chain(done, future))
+                        self._pending.appendleft(_QueuedJob(queued.job, retry, queued.attempt + 1))
+                    else:
+                        self._jobs_failed += 1
+                    self._dispatch()
+                if not retried:
+                    queued.future.set_exception(e)
+                continue
+
+            device.refresh_status()
+            with self._lock:
+                device.busy = False
+                device.jobs_done += 1
+                self._jobs_done += 1
+                self._dispatch()
+            queued.future.set_result(device.name)
+
+
+def _chain(done: Future, future: Future) -> None:
+    if done.cancelled():
+        # the future of a retried job is running already and cannot be cancelled
+        if not future.cancel():
+            future.set_exception(CancelledError())
+    elif done.exception() is not None:
+        future.set_exception(done.exception())
+    else:
+        future.set_result(done.result())
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from itertools import chain
+from os import PathLike
+from typing import Iterable, Iterator
+
 from .constants import Media, Resolution
 from .page import PageType
 
@@ -30,14 +34,47 @@ class Job:
         self.resolution = resolution
 
         self._pages = []
+        self._lazy = False
 
-    def __iter__(self):
-        return iter(self._pages)
+    def __iter__(self) -> Iterator[PageType]:
+        return chain.from_iterable(
+            (pages,) if not isinstance(pages, _LazyPages) else pages for pages in self._pages
+        )
 
     def __len__(self):
+        if self._lazy:
+            raise TypeError("The number of pages of a job with lazily added pages is not known")
         return len(self._pages)
 
+    @classmethod
+    def from_spool(cls, path: str | PathLike) -> Job:
+        """Read a job written by to_spool. The pages are memory mapped from
+        the file and only read while they are printed. Close the job, or use
+        it as context manager, to release the mapping."""
+        from .spool import read_spool
+
+        return read_spool(path)
+
+    def to_spool(self, path: str | PathLike, encode: bool = True) -> int:
+        """Write the job to a spool file and return the number of pages. With
+        encode, the pages are stored as the raster commands sent to the
+        printer, so printing the spooled job skips encoding."""
+        from .spool import write_spool
+
+        return write_spool(self, path, encode)
+
+    def add_pages(self, pages: Iterable[PageType]):
+        """Add pages from an iterable, e.g. a generator. The pages are only
+        created and checked while the job is printed, so a job with lazily added
+        pages can only be printed once."""
+        self._pages.append(_LazyPages(self, pages))
+        self._lazy = True
+
     def add_page(self, page: PageType):
+        self._check_page(page)
+        self._pages.append(page)
+
+    def _check_page(self, page: PageType):
         width = self.media.value.printarea
         if page.width != width:
             raise RuntimeError("Page width does not match media width")
@@ -49,4 +86,14 @@ class Job:
             min_length = 62
         if page.length < min_length:
             raise RuntimeError("Page is not long enough")
-        self._pages.append(page)
+
+
+class _LazyPages:
+    def __init__(self, job: Job, pages: Iterable[PageType]):
+        self._job = job
+        self._pages = pages
+
+    def __iter__(self) -> Iterator[PageType]:
+        for page in self._pages:
+            self._job._check_page(page)
+            yield page
@@ -9,5 +9,15 @@ class Item(ABC):
     @abstractmethod
     def render(self) -> Image: ...
 
+    def measure(self) -> tuple[int, int]:
+        """Size (length, height) of the rendered item. Items override this to
+        compute the size without rendering."""
+        return self.render().size
+
+    def draw_into(self, canvas: Image, offset: tuple[int, int]) -> None:
+        """Draw the item into canvas with its upper left corner at offset.
+        Anything outside of canvas is cut off."""
+        canvas.paste(self.render(), offset)
+
 
 ItemType = TypeVar("ItemType", bound=Item)
@@ -5,27 +5,45 @@ from PIL import Image
 from . import Item, ItemType
 
 class Box(Item):
+    """Items next to each other, or below each other if vertical.
+
+    The size of the box is measured from the sizes of its items, and the
+    items are drawn straight into a single image, so nested boxes do not
+    render intermediate images."""
+
     def __init__(self, height: int, *items: ItemType, vertical: bool = False, left_padding: int = 0) -> None:
         self.height = height
         self.items = items
         self._vertical = vertical
         self._left_padding = left_padding
 
+    def measure(self) -> tuple[int, int]:
+        sizes = [item.measure() for item in self.items]
+        if self._vertical:
+            assert self.height == sum([height for _, height in sizes])
+            return max([length for length, _ in sizes]) + self._left_padding, self.height
+        return sum([length for length, _ in sizes]) + self._left_padding, self.height
+
     def render(self) -> Image:
-        rendered_images = [item.render() for item in self.items]
+        image = Image.new("1", self.measure(), "white")
+        self.draw_into(image, (0, 0))
+        return image
+
+    def draw_into(self, canvas: Image, offset: tuple[int, int]) -> None:
+        x, y = offset
         if self._vertical:
-            length = max([rendered_image.size[0] for rendered_image in rendered_images]) + self._left_padding
-            assert self.height == sum([rendered_image.size[1] for rendered_image in rendered_images])
-            image = Image.new("1", (length, self.height), "white")
-            xpos = 0
-            for rendered_image in rendered_images:
-                image.paste(rendered_image, (self._left_padding, xpos))
-                xpos += rendered_image.size[1]
+            x += self._left_padding
+            for item in self.items:
+                length, height = item.measure()
+                item.draw_into(canvas, (x, y))
+                y += height
         else:
-            length = sum([rendered_image.size[0] for rendered_image in rendered_images]) + self._left_padding
-            image = Image.new("1", (length, self.height), "white")
-            ypos = self._left_padding
-            for rendered_image in rendered_images:
-                image.paste(rendered_image, (ypos, 0))
-                ypos += rendered_image.size[0]
-        return image
+            x += self._left_padding
+            for item in self.items:
+                length, height = item.measure()
+                if height > self.height:
+                    # do not draw over whatever is below the box
+                    canvas.paste(item.render().crop((0, 0, length, self.height)), (x, y))
+                else:
+                    item.draw_into(canvas, (x, y))
+                x += length
@@ -1,21 +1,21 @@
 from logging import getLogger
 
-from PIL.Image import Image
+from PIL import Image
 
 from .label import ItemType
 from ..constants import Resolution
 from ..page import BasePage
-from ..utils.image import bitmap_to_image, image_to_bitmap
+from ..utils.image import bitmap_to_image, image_to_bitmap, scale_to_resolution
 
 logger = getLogger(__name__)
 
 
 class Flag(BasePage):
-    def __init__(self, item1: ItemType, item2: ItemType, spacing=265) -> None:
-        rendered_images = [item1.render(), item2.render()]
-        image_max_length = max([rendered_image.size[0] for rendered_image in rendered_images])
+    def __init__(self, item1: ItemType, item2: ItemType, spacing=265, resolution: Resolution = Resolution.LOW) -> None:
+        sizes = [item1.measure(), item2.measure()]
+        image_max_length = max([size[0] for size in sizes])
         length = 2 * image_max_length + spacing
-        height = max([rendered_image.size[1] for rendered_image in rendered_images])
+        height = max([size[1] for size in sizes])
 
         line_length = 2 + spacing % 2
         data = 0x0
@@ -30,19 +30,14 @@ class Flag(BasePage):
 
         white_spacing = (spacing - line_length) // 2
 
-        # spacing_image = Image.new("1", ((spacing - line_length) // 2, height), "white")
-        rendered_images.insert(1, line_image)
-        positions = [0, image_max_length + white_spacing, line_length + white_spacing]
-
         image = Image.new("1", (length, height), "white")
-        ypos = 0
-        for rendered_image, position in zip(rendered_images, positions):
-            ypos += position
-            image.paste(rendered_image, (ypos, 0))
-        self._bitmap, self._width, self._length = image_to_bitmap(image)
-        self._resolution = Resolution.LOW
-
-        logger.debug(f"flag width {self._width}")
-        logger.debug(f"flag length {self._length}")
+        item1.draw_into(image, (0, 0))
+        xpos = image_max_length + white_spacing
+        image.paste(line_image, (xpos, 0))
+        item2.draw_into(image, (xpos + line_length + white_spacing, 0))
+        self._bitmap, self._width, self._length = image_to_bitmap(scale_to_resolution(image, resolution))
+        self._resolution = resolution
+
+        logger.debug("flag width %s, length %s", self._width, self._length)
 
         super().__init__()
@@ -3,18 +3,24 @@ from logging import getLogger
 from . import ItemType
 from ..constants import Resolution
 from ..page import BasePage
-from ..utils.image import image_to_bitmap
+from ..utils.image import image_to_bitmap, scale_to_resolution
 
 logger = getLogger(__name__)
 
 
 class Label(BasePage):
-    def __init__(self, item: ItemType) -> None:
+    """Page printing a rendered item.
+
+    Items are rendered at 180 dpi. For Resolution.HIGH the rendered image is
+    stretched along the length of the label, so cached renderings of the item
+    are reused at both resolutions."""
+
+    def __init__(self, item: ItemType, resolution: Resolution = Resolution.LOW) -> None:
         self.item = item
-        self._bitmap, self._width, self._length = image_to_bitmap(self.item.render())
-        self._resolution = Resolution.LOW
+        image = scale_to_resolution(self.item.render(), resolution)
+        self._bitmap, self._width, self._length = image_to_bitmap(image)
+        self._resolution = resolution
 
-        logger.debug(f"label width {self._width}")
-        logger.debug(f"label length {self._length}")
+        logger.debug("label width %s, length %s", self._width, self._length)
 
         super().__init__()
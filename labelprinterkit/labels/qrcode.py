@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from logging import getLogger
 from typing import Optional
 
 from PIL import Image
 
 from . import Item
+from ..utils.cache import RenderCache
 
 try:
     from qrcode import QRCode as _QRCode
@@ -16,6 +19,23 @@ except ImportError:
     ERROR_CORRECT_Q = 3
     ERROR_CORRECT_H = 2
 
+logger = getLogger(__name__)
+
+# Rendered images shared by all QRCode items with the same configuration
+qrcode_render_cache = RenderCache()
+
+
+@lru_cache(maxsize=1024)
+def _modules(data: str, error_correction: int) -> Image:
+    """The modules of the smallest QR code holding data, one pixel per module"""
+    qr = _QRCode(error_correction=error_correction, border=0)
+    qr.add_data(data)
+    qr.make(fit=True)
+    count = qr.modules_count
+    image = Image.new("1", (count, count), "white")
+    image.putdata([0 if module else 1 for row in qr.modules for module in row])
+    return image
+
 
 class QRCode(Item):
     def __init__(self, width: int, data: str, error_correction: Optional[ERROR_CORRECT_M | ERROR_CORRECT_H | ERROR_CORRECT_Q] = None, box_size: int | None = None, border: int = 0) -> None:
@@ -26,40 +46,48 @@ class QRCode(Item):
         self._error_correction = error_correction
         self._box_size = box_size
         self._border = border
+        self._measured = None
 
     def render(self) -> Image:
-        if self._box_size is None:
-            box_size = 2
-        else:
-            box_size = self._box_size
-        probe_box_size = box_size
-        qr_image = None
+        key = (self._data, self._width, self._error_correction, self._border, self._box_size)
+        return qrcode_render_cache.get(key, self._render)
+
+    def draw_into(self, canvas: Image, offset: tuple[int, int]) -> None:
+        key = (self._data, self._width, self._error_correction, self._border, self._box_size)
+        canvas.paste(qrcode_render_cache.get(key, self._render, copy=False), offset)
+
+    def measure(self) -> tuple[int, int]:
+        if self._measured is None:
+            error_correction, box_size = self._fit()
+            modules = _modules(self._data, error_correction).size[0] + 2 * self._border
+            self._measured = (modules * box_size, self._width)
+        return self._measured
+
+    def _fit(self) -> tuple[int, int]:
+        """Pick the error correction and the largest box size fitting into the width"""
         if self._error_correction is None:
             error_corrections = [ERROR_CORRECT_H, ERROR_CORRECT_Q, ERROR_CORRECT_M, ERROR_CORRECT_L]
         else:
             error_corrections = [self._error_correction]
-        error_correction = None
+        min_box_size = 2 if self._box_size is None else self._box_size
         for error_correction in error_corrections:
-            while True:
-                logger.debug(f"qrcode: {self._data}, probe_box_size: {probe_box_size}, EC: {error_correction}")
-                qr = _QRCode(error_correction=error_correction, box_size=probe_box_size, border=self._border)
-                qr.add_data(self._data)
-                new_image = qr.make_image()
-                if new_image.size[0] <= self._width:
-                    qr_image = new_image
-                    probe_box_size += 1
-                elif qr_image is None:
-                    break
-                else:
-                    break
+            modules = _modules(self._data, error_correction).size[0] + 2 * self._border
+            box_size = self._width // modules
+            if box_size >= min_box_size:
                 if self._box_size is not None:
-                    break
-            if qr_image:
-                break
-        if not qr_image:
-            raise RuntimeError("Data does not fit in qrcode")
+                    box_size = self._box_size
+                return error_correction, box_size
+        raise RuntimeError("Data does not fit in qrcode")
+
+    def _render(self) -> Image:
+        error_correction, box_size = self._fit()
+        logger.debug("qrcode: %s, final box_size: %s, EC: %s", self._data, box_size, error_correction)
 
-        logger.debug(f"qrcode: {self._data}, final box_size: {probe_box_size - 1}, EC: {error_correction}")
+        modules = _modules(self._data, error_correction)
+        size = (modules.size[0] + 2 * self._border) * box_size
+        qr_image = Image.new("1", (size, size), "white")
+        offset = self._border * box_size
+        qr_image.paste(modules.resize((modules.size[0] * box_size,) * 2, Image.NEAREST), (offset, offset))
 
         rest = self._width - qr_image.size[1]
         image = Image.new("1", (qr_image.size[0], self._width), "white")
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Mapping
+
+from PIL import Image
+
+from . import Item, ItemType
+from ..constants import Resolution
+from ..page import Page
+from ..utils.image import image_to_bitmap, scale_to_resolution
+
+# offsets of the slots drawn while a LabelTemplate renders its static part
+_recorded_offsets: ContextVar[dict[Slot, tuple[int, int]] | None] = ContextVar("_recorded_offsets", default=None)
+
+
+class Slot(Item):
+    """Placeholder of fixed size for the variable content of a LabelTemplate.
+
+    With factory, the value given for the slot is turned into an item by
+    factory, e.g. lambda serial: Text(35, serial, font). Otherwise the value
+    has to be an item already."""
+
+    def __init__(self, name: str, length: int, height: int, factory: Callable[[Any], ItemType] | None = None) -> None:
+        self.name = name
+        self.length = length
+        self.height = height
+        self.factory = factory
+
+    def measure(self) -> tuple[int, int]:
+        return self.length, self.height
+
+    def render(self) -> Image:
+        return Image.new("1", (self.length, self.height), "white")
+
+    def draw_into(self, canvas: Image, offset: tuple[int, int]) -> None:
+        # the template remembers where to put the content of the slot
+        offsets = _recorded_offsets.get()
+        if offsets is not None:
+            offsets[self] = offset
+        canvas.paste(255, (*offset, offset[0] + self.length, offset[1] + self.height))
+
+    def item(self, value) -> ItemType:
+        item = self.factory(value) if self.factory is not None else value
+        length, height = item.measure()
+        if length > self.length or height > self.height:
+            raise RuntimeError(f"{length}x{height} item does not fit into slot {self.name} "
+                               f"of {self.length}x{self.height}")
+        return item
+
+
+class LabelTemplate:
+    """A label layout rendered once, with slots for the content changing
+    from label to label.
+
+    item is the layout, typically a Box holding Slots next to the static
+    items. The static part is rendered when the template is created. For
+    every label only the slot contents are rendered and drawn into a copy of
+    it, so the cost per label depends on the variable content only. A slot
+    has to be drawn uncropped, a slot taller than its box raises a
+    ValueError."""
+
+    def __init__(self, item: ItemType) -> None:
+        self.item = item
+        self.slots: dict[str, Slot] = {}
+        for slot in _slots(item):
+            if slot.name in self.slots:
+                raise ValueError(f"Slot {slot.name} is used twice")
+            self.slots[slot.name] = slot
+        self._base = Image.new("1", item.measure(), "white")
+        offsets = {}
+        token = _recorded_offsets.set(offsets)
+        try:
+            item.draw_into(self._base, (0, 0))
+        finally:
+            _recorded_offsets.reset(token)
+        self._offsets: dict[str, tuple[int, int]] = {}
+        for name, slot in self.slots.items():
+            if slot not in offsets:
+                raise ValueError(f"Slot {name} is not drawn into the label")
+            self._offsets[name] = offsets[slot]
+
+    def render(self, values: Mapping[str, Any]) -> Image:
+        """Render the label with values, a value for every slot by name"""
+        image = self._base.copy()
+        for name, slot in self.slots.items():
+            slot.item(values[name]).draw_into(image, self._offsets[name])
+        return image
+
+    def page(self, values: Mapping[str, Any], resolution: Resolution = Resolution.LOW) -> Page:
+        """Render the label with values as page"""
+        bitmap, width, length = image_to_bitmap(scale_to_resolution(self.render(values), resolution))
+        return Page(bitmap, width, length, resolution)
+
+    def pages(self, records: Iterator[Mapping[str, Any]], resolution: Resolution = Resolution.LOW) -> Iterator[Page]:
+        """Render a page for every record, e.g. to add to a job with add_pages"""
+        for values in records:
+            yield self.page(values, resolution)
+
+
+def _slots(item: Item) -> Iterator[Slot]:
+    if isinstance(item, Slot):
+        yield item
+    for child in getattr(item, "items", ()):
+        for slot in _slots(child):
+            # a box crops items taller than itself, the content of the slot
+            # would be drawn over whatever is below the box
+            if child.measure()[1] > item.height:
+                raise ValueError(f"Slot {slot.name} is cropped by its box")
+            yield slot
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from logging import getLogger
 from math import ceil
 from typing import NamedTuple
@@ -7,10 +8,15 @@ from typing import NamedTuple
 from PIL import Image, ImageDraw, ImageFont
 
 from . import Item
+from ..utils.cache import RenderCache
+from ..utils.font import font_identity, get_font
 from ..utils.image import crop
 
 logger = getLogger(__name__)
 
+# Rendered images shared by all Text items with the same configuration
+text_render_cache = RenderCache()
+
 
 class Padding(NamedTuple):
     left: int
@@ -24,7 +30,7 @@ class Padding(NamedTuple):
 
 
 class Text(Item):
-    def __init__(self, height: int, text: str, font_path: str, font_index: int = 0, font_size: int | None = None, padding: Padding = Padding(0, 0, 0, 0)) -> None:
+    def __init__(self, height: int, text: str, font_path: str, font_index: int = 0, font_size: int | None = None, padding: Padding = Padding(0, 0, 0, 0), cache: bool = True) -> None:
         self.text = text
         self.height = height
         self.font_path = font_path
@@ -34,20 +40,52 @@ class Text(Item):
         if any([i < 0 for i in padding]):
             raise ValueError("Negative padding is not supported: {padding}")
         self.padding = padding
+        self.cache = cache
+        self._measured = None
 
     def render(self) -> Image:
+        return self._cached_render(copy=True)
+
+    def draw_into(self, canvas: Image, offset: tuple[int, int]) -> None:
+        canvas.paste(self._cached_render(copy=False), offset)
+
+    def _cached_render(self, copy: bool) -> Image:
+        font = font_identity(self.font_path)
+        if not self.cache or font is None:
+            return self._render()
+        key = (self.text, self.height, font, self.font_index, self.font_size, tuple(self.padding))
+        return text_render_cache.get(key, self._render, copy)
+
+    def measure(self) -> tuple[int, int]:
+        # The size only depends on the font metrics. It is kept along with the
+        # configuration it was measured for, so changing the item measures anew.
+        key = (self.text, self.height, self.font_path, self.font_index, self.font_size, self.padding)
+        if self._measured is None or self._measured[0] != key:
+            self._measured = (key, (self.padding.left + self._text_length() + self.padding.right, self.height))
+        return self._measured[1]
+
+    def _font_size(self) -> int:
+        if self.font_size is None:
+            return self._calc_font_size(self.height - self.padding.top - self.padding.bottom)
+        return self.font_size
+
+    def _text_length(self) -> int:
+        font = get_font(self.font_path, self._font_size(), self.font_index)
+        text_x, _ = _get_text_size(font, self.text)
+        return text_x
+
+    def _render(self) -> Image:
         iheight = self.height - self.padding.top - self.padding.bottom
         if self.font_size is None:
             font_size = self._calc_font_size(iheight)
-            logger.debug(
-                f"text: {self.text}, calculated font size: {font_size}")
+            logger.debug("text: %s, calculated font size: %s", self.text, font_size)
         else:
             font_size = self.font_size
-        font = ImageFont.truetype(self.font_path, font_size, self.font_index)
-        text_x, _ = self.__getTextSize(font, self.text)
+        font = get_font(self.font_path, font_size, self.font_index)
+        text_x, _ = _get_text_size(font, self.text)
         image = Image.new("1", (self.padding.left + text_x +
                           self.padding.right, self.height), "white")
-        fimage = Image.new("1", self.__getTextSize(font, self.text), "white")
+        fimage = Image.new("1", _get_text_size(font, self.text), "white")
         draw = ImageDraw.Draw(fimage)
         draw.text((0, 0), self.text, "black", font)
         fimage = crop(fimage)
@@ -55,37 +93,48 @@ class Text(Item):
         return image
 
     def _calc_font_size(self, height: int) -> int:
-        lower = 1
-        upper = 1
-        while True:
-            font = ImageFont.truetype(self.font_path, upper)
-            image = Image.new("1", self.__getTextSize(
-                font, self.text), "white")
-            draw = ImageDraw.Draw(image)
-            draw.text((0, 0), self.text, "black", font)
-            font_height = crop(image).size[1]
-            if font_height >= height:
-                break
-            lower = upper
-            upper *= 2
-        while True:
-            test = ceil((upper + lower) / 2)
-            font = ImageFont.truetype(self.font_path, test)
-            image = Image.new("1", self.__getTextSize(
-                font, self.text), "white")
-            draw = ImageDraw.Draw(image)
-            draw.text((0, 0), self.text, "black", font)
-            font_height = crop(image).size[1]
-            if upper - lower <= 1:
-                return lower
-            elif font_height > height:
-                upper = test
-            elif font_height < height:
-                lower = test
-            else:
-                return test
+        font = font_identity(self.font_path)
+        if font is None:
+            return _search_font_size(self.font_path, self.font_index, self.text, height)
+        return _solve_font_size(font, self.font_path, self.font_index, self.text, height)
 
-    @staticmethod
-    def __getTextSize(font: ImageFont.FreeTypeFont, text):
-        left, top, right, bottom = font.getbbox(text)
-        return (right - left, bottom - top)
+
+def _get_text_size(font: ImageFont.FreeTypeFont, text):
+    left, top, right, bottom = font.getbbox(text)
+    return (right - left, bottom - top)
+
+
+def _text_height(font_path, font_index: int, text: str, size: int) -> int:
+    font = get_font(font_path, size, font_index)
+    image = Image.new("1", _get_text_size(font, text), "white")
+    draw = ImageDraw.Draw(image)
+    draw.text((0, 0), text, "black", font)
+    return crop(image).size[1]
+
+
+def _search_font_size(font_path, font_index: int, text: str, height: int) -> int:
+    lower = 1
+    upper = 1
+    while True:
+        font_height = _text_height(font_path, font_index, text, upper)
+        if font_height >= height:
+            break
+        lower = upper
+        upper *= 2
+    while True:
+        if upper - lower <= 1:
+            return lower
+        test = ceil((upper + lower) / 2)
+        font_height = _text_height(font_path, font_index, text, test)
+        if font_height > height:
+            upper = test
+        elif font_height < height:
+            lower = test
+        else:
+            return test
+
+
+@lru_cache(maxsize=4096)
+def _solve_font_size(font: tuple, font_path, font_index: int, text: str, height: int) -> int:
+    # font identifies the font file, so a replaced file is solved again
+    return _search_font_size(font_path, font_index, text, height)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from math import ceil
-from typing import TypeVar
+from typing import Iterable, Iterator, TypeVar
 
 from PIL import Image
 
@@ -11,6 +11,13 @@ from .utils.image import bitmap_to_image, image_to_bitmap
 
 
 class BasePage(ABC):
+    """A page of raster lines, each ceil(width / 8) bytes long.
+
+    The bitmap can be any object supporting the buffer protocol, like bytes,
+    bytearray, mmap or a C contiguous NumPy array. raster gives a flat
+    memoryview of it, and iterating over the page or its chunks yields views
+    into the bitmap instead of copies."""
+
     _bitmap: bytes
     _width: int
     _length: int
@@ -19,12 +26,32 @@ class BasePage(ABC):
     def __init__(self):
         self.__byte_per_line = None
         self.__image = None
-        assert self._byte_per_line * self.length == len(self.bitmap)
+        self.__raster = None
+        self._check_bitmap()
+
+    def _check_bitmap(self):
+        assert self._byte_per_line * self.length == self.raster.nbytes
 
     @property
     def bitmap(self) -> bytes:
+        if not isinstance(self._bitmap, bytes):
+            return self.raster.tobytes()
         return self._bitmap
 
+    @property
+    def raster(self) -> memoryview:
+        """The bitmap as flat, read only memoryview of bytes"""
+        if self.__raster is None:
+            self.__raster = memoryview(self._bitmap).cast("B").toreadonly()
+        return self.__raster
+
+    def _release(self) -> None:
+        """Release the view of the bitmap, e.g. before the memory it is in
+        gets unmapped"""
+        if self.__raster is not None:
+            self.__raster.release()
+            self.__raster = None
+
     @property
     def width(self):
         return self._width
@@ -43,14 +70,29 @@ class BasePage(ABC):
             self.__byte_per_line = ceil(self.width / 8)
         return self.__byte_per_line
 
-    def __iter__(self):
-        for i in range(0, len(self.bitmap), self._byte_per_line):
-            yield self.bitmap[i : i + self._byte_per_line]
+    def __iter__(self) -> Iterator[memoryview]:
+        raster = self.raster
+        for i in range(0, len(raster), self._byte_per_line):
+            yield raster[i : i + self._byte_per_line]
+
+    def chunks(self, lines: int) -> Iterator[memoryview]:
+        """Yield views of the bitmap in pieces of whole raster lines, at most
+        lines lines each"""
+        size = lines * self._byte_per_line
+        raster = self.raster
+        for i in range(0, len(raster), size):
+            yield raster[i : i + size]
+
+    def encoded(self, padding: int) -> bytes | None:
+        """The G raster commands of the page shifted by padding, if the page
+        holds them already encoded, like pages read from a spool. Printers send
+        these as they are instead of encoding the bitmap."""
+        return None
 
     @property
     def image(self) -> Image:
         if not self.__image:
-            self.__image = bitmap_to_image(self._bitmap, self._width, self.length)
+            self.__image = bitmap_to_image(self.raster, self._width, self.length)
         return self.__image
 
 
@@ -58,7 +100,8 @@ PageType = TypeVar("PageType", bound=BasePage)
 
 
 class Page(BasePage):
-    def __init__(self, bitmap: bytes, width: int, length: int, resolution: Resolution = Resolution.LOW):
+    def __init__(self, bitmap: bytes | bytearray | memoryview, width: int, length: int,
+                 resolution: Resolution = Resolution.LOW):
         self._bitmap = bitmap
         self._width = width
         self._length = length
@@ -69,3 +112,53 @@ class Page(BasePage):
     def from_image(cls, image: Image, resolution: Resolution = Resolution.LOW) -> Page:
         bitmap, width, length = image_to_bitmap(image)
         return cls(bitmap, width, length, resolution)
+
+
+class StreamPage(BasePage):
+    """Page whose raster lines are produced lazily while the page is printed.
+
+    lines is an iterable, for example a generator, of bytes objects holding one
+    or more whole raster lines each. The page can only be streamed once and its
+    length has to be known up front. Accessing bitmap reads the whole stream
+    into memory."""
+
+    def __init__(self, lines: Iterable[bytes], width: int, length: int, resolution: Resolution = Resolution.LOW):
+        self._lines = iter(lines)
+        self._bitmap = None
+        self._width = width
+        self._length = length
+        self._resolution = resolution
+        super().__init__()
+
+    def _check_bitmap(self):
+        pass
+
+    @property
+    def bitmap(self) -> bytes:
+        if self._bitmap is None:
+            self._bitmap = b"".join(self._stream())
+        return self._bitmap
+
+    @property
+    def raster(self) -> memoryview:
+        return memoryview(self.bitmap)
+
+    def chunks(self, lines: int) -> Iterator[bytes]:
+        if self._bitmap is not None:
+            yield from super().chunks(lines)
+        else:
+            yield from self._stream()
+
+    def _stream(self) -> Iterator[bytes]:
+        if self._lines is None:
+            raise RuntimeError("Stream page has already been read")
+        lines, self._lines = self._lines, None
+        size = 0
+        for chunk in lines:
+            if len(chunk) % self._byte_per_line:
+                raise RuntimeError("Stream page yielded a partial raster line")
+            size += len(chunk)
+            yield chunk
+        if size != self._byte_per_line * self.length:
+            raise RuntimeError(
+                f"Stream page yielded {size // self._byte_per_line} lines instead of {self.length}")
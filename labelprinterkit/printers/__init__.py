@@ -1,15 +1,22 @@
-import logging
+import re
 import struct
 from abc import ABC, abstractmethod
 from logging import getLogger
-from typing import TypeVar
+from math import ceil
+from time import perf_counter
+from typing import Iterator, TypeVar
 
 import packbits
 
+from .monitor import StatusMonitor
+from .observer import ObservedBackend, PrintObserver
+from .preamble import get_preamble
 from .status import Status
-from ..backends import BaseBackend, UniDirectionalBackend
-from ..constants import AdvancedModeSettings, Media, Resolution, StatusCodes, VariousModesSettings
+from ..backends import BaseBackend
+from ..backends.buffered import BufferedBackend
+from ..constants import Resolution
 from ..job import Job
+from ..page import BasePage
 
 logger = getLogger(__name__)
 
@@ -40,21 +47,148 @@ def encode_line(bitmap_line: bytes, padding) -> bytes:
 
     # pad to 16 bytes
     compressed = packbits.encode(padded)
-    logger.debug("original bitmap: %s", bitmap_line)
-    logger.debug("padded bitmap %s", padded)
-    logger.debug("packbit compressed %s", compressed)
     # <h: big endian short (2 bytes)
     prefix = struct.pack("<H", len(compressed))
 
     return prefix + compressed
 
 
+_RUNS = re.compile(rb"(.)\1+", re.DOTALL)
+
+
+def _packbits_encode(data: bytes) -> bytes:
+    # Same output as packbits.encode for data of up to 127 bytes, but the runs
+    # are located by the regex engine instead of a byte by byte Python loop.
+    result = bytearray()
+    pos = 0
+    for run in _RUNS.finditer(data):
+        start, end = run.span()
+        if start > pos:
+            result.append(start - pos - 1)
+            result += data[pos:start]
+        result.append(257 - (end - start))
+        result.append(data[start])
+        pos = end
+    if pos < len(data):
+        result.append(len(data) - pos - 1)
+        result += data[pos:]
+    return bytes(result)
+
+
+_BLANK_LINE = bytes(16)
+
+# Encoded lines kept per job by the printers, see encode_page
+LINE_CACHE_SIZE = 4096
+
+
+def encode_page(bitmap: bytes, width: int, padding: int, cache: dict[bytes, bytes] | None = None,
+                zero_raster: bool = False) -> bytes:
+    """Encode a whole page bitmap into the G raster command stream.
+
+    The output is identical to sending b"G" + encode_line(line, padding) for
+    every line of the page, but the lines are padded and shifted all at once.
+    A run of identical lines is only compressed once. With cache, the encoded
+    commands are looked up by line content and up to LINE_CACHE_SIZE new lines
+    are added, so a cache shared by the pages of a job only ever compresses
+    a line once. With zero_raster, blank lines are sent as Z command."""
+    byte_per_line = ceil(width / 8)
+    if not byte_per_line:
+        return b""
+    if byte_per_line * 8 + padding > 128:
+        # the shifted line may not fit into 16 bytes, let encode_line decide
+        return b"".join(
+            b"G" + encode_line(bitmap[i : i + byte_per_line], padding)
+            for i in range(0, len(bitmap), byte_per_line)
+        )
+
+    # Spread the lines over 16 byte slots (right aligned, like int.to_bytes
+    # does) and shift the whole page by the left margin in one go. Every
+    # shifted line still fits into its slot, so no bits leak into the next one.
+    line_count = len(bitmap) // byte_per_line
+    padded = bytearray(16 * line_count)
+    offset = 16 - byte_per_line
+    for i in range(byte_per_line):
+        padded[offset + i :: 16] = bitmap[i::byte_per_line]
+    if padding:
+        padded = (int.from_bytes(padded, byteorder="big") << padding).to_bytes(len(padded), byteorder="big")
+    else:
+        padded = bytes(padded)
+
+    stream = bytearray()
+    previous = None
+    command = b""
+    for i in range(0, len(padded), 16):
+        line = padded[i : i + 16]
+        if line != previous:
+            command = cache.get(line) if cache is not None else None
+            if command is None:
+                if zero_raster and line == _BLANK_LINE:
+                    command = b"Z"
+                else:
+                    compressed = _packbits_encode(line)
+                    command = b"G" + struct.pack("<H", len(compressed)) + compressed
+                if cache is not None and len(cache) < LINE_CACHE_SIZE:
+                    cache[line] = command
+            previous = line
+        stream += command
+    return bytes(stream)
+
+
+def decode_page(stream: bytes, width: int, padding: int) -> bytes:
+    """Decode a raster command stream as created by encode_page back into the
+    page bitmap"""
+    byte_per_line = ceil(width / 8)
+    mask = (1 << (byte_per_line * 8)) - 1
+    bitmap = bytearray()
+    view = memoryview(stream)
+    pos = 0
+    while pos < len(view):
+        if view[pos] == ord("Z"):
+            bitmap += bytes(byte_per_line)
+            pos += 1
+            continue
+        if view[pos] != ord("G"):
+            raise IOError(f"Unexpected raster command {bytes(view[pos:pos + 1])}")
+        (size,) = struct.unpack_from("<H", view, pos + 1)
+        line = packbits.decode(bytes(view[pos + 3 : pos + 3 + size]))
+        line_int = int.from_bytes(line, byteorder="big") >> padding
+        bitmap += (line_int & mask).to_bytes(byte_per_line, byteorder="big")
+        pos += 3 + size
+    return bytes(bitmap)
+
+
+def _encode_chunks(page: BasePage, padding: int, lines: int, size: int, cache: dict[bytes, bytes] | None = None,
+                   zero_raster: bool = False) -> Iterator[tuple[int, bytes]]:
+    # Yield the G raster commands of page in pieces, each with the number of
+    # bitmap bytes it stands for. Pages holding their raster commands already
+    # are passed through in pieces of size bytes.
+    encoded = page.encoded(padding)
+    if encoded is not None:
+        raw = page.length * ceil(page.width / 8)
+        for i in range(0, len(encoded), size):
+            yield raw if i == 0 else 0, encoded[i : i + size]
+        return
+    for chunk in page.chunks(lines):
+        yield len(chunk), encode_page(chunk, page.width, padding, cache, zero_raster)
+
+
 class GenericPrinter(BasePrinter):
     _SUPPORTED_RESOLUTIONS = (Resolution.LOW, Resolution.HIGH)
     _FEATURE_HALF_CUT = True
+    # Blank raster lines are sent as Z command instead of a G command
+    _FEATURE_ZERO_RASTER = True
 
-    def __init__(self, backend: BackendType):
+    # Seconds to wait for a page to be printed, per raster line
+    _PAGE_TIMEOUT_PER_LINE = 0.1
+    # Raster lines encoded at once and bytes buffered before a flush
+    _CHUNK_LINES = 4096
+    _MAX_BUFFER = 1 << 20
+
+    def __init__(self, backend: BackendType, monitor: StatusMonitor | None = None,
+                 observer: PrintObserver | None = None):
         super().__init__(backend)
+        self._monitor = monitor if monitor is not None else StatusMonitor()
+        self.observer = observer
 
     def reset(self):
         self._backend.write(b"\x00" * 100)  # Invalidate command
@@ -63,7 +197,7 @@ class GenericPrinter(BasePrinter):
     def get_status(self) -> Status:
         if hasattr(self._backend, "get_status"):
             data = self._backend.get_status()
-        elif isinstance(self._backend, UniDirectionalBackend):
+        elif not hasattr(self._backend, "read"):
             raise RuntimeError("Backend is unidirectional")
         else:
             self.reset()
@@ -82,100 +216,77 @@ class GenericPrinter(BasePrinter):
 
         self.reset()
 
-        if job.media in (Media.NO_MEDIA, Media.UNSUPPORTED_MEDIA):
-            raise RuntimeError("Unsupported Media")
-
-        if job.resolution not in self._SUPPORTED_RESOLUTIONS:
-            raise RuntimeError("Resolution is not supported by this printer.")
-
-        media_type = job.media.value.media_type.value.to_bytes(1, "big")
-        media_size = job.media.value.width.to_bytes(1, "big")
+        preamble = get_preamble(type(self), job)
         offset = job.media.value.lmargin
 
-        various_mode = 0
-        if job.auto_cut:
-            various_mode = various_mode | VariousModesSettings.AUTO_CUT.value
-            auto_cut = True
-        else:
-            auto_cut = False
-        if job.mirror_printing:
-            various_mode = various_mode | VariousModesSettings.MIRROR_PRINTING.value
-        various_mode = various_mode.to_bytes(1, "big")
-
-        advanced_mode = 0
-        if job.half_cut:
-            if not self._FEATURE_HALF_CUT:
-                raise RuntimeError(
-                    "Half cut is not supported by this printer.")
-            advanced_mode = advanced_mode | AdvancedModeSettings.HALF_CUT.value
-        if not job.chain:
-            advanced_mode = advanced_mode | AdvancedModeSettings.CHAIN_PRINTING.value
-        if job.special_tape:
-            advanced_mode = advanced_mode | AdvancedModeSettings.SPECIAL_TAPE.value
-        if job.resolution == Resolution.HIGH:
-            margin = b"\x1C\x00"
-            advanced_mode = advanced_mode | AdvancedModeSettings.HIGH_RESOLUTION.value
-        else:
-            margin = b"\x0E\x00"
-        advanced_mode = advanced_mode.to_bytes(1, "big")
-
-        cut_each = job.cut_each.to_bytes(1, "big")
-
-        for i, page in enumerate(job):
-            # switch dynamic command mode: enable raster mode
-            self._backend.write(b"\x1Bia\x01")
-
-            # Print information command
-            # b'\x1Biz\x86\x01\x0c\x00\x00\x00\00\x00\x00'
-            information_command = b"\x1Biz\x86" + media_type + \
-                media_size + b"\x00\x00\x00\00\x00\x00"
-            self._backend.write(information_command)
-            if i == 0 and auto_cut:
-                # Ugly workaround
-                # Print information command a second time forces cutting after first page.
-                # No idea why this is needed, but it works
-                self._backend.write(information_command)
-
-            # Various mode
-            logger.debug(f"various_mode: {various_mode}")
-            self._backend.write(b"\x1BiM" + various_mode)
-
-            # Advanced mode
-            logger.debug(f"advanced_mode: {advanced_mode}")
-            self._backend.write(b"\x1biK" + advanced_mode)
-
-            # margin
-            self._backend.write(b"\x1bid" + margin)
-
-            if auto_cut:
-                # Configure after how many pages a cut should be done
-                self._backend.write(b"\x1BiA" + cut_each)
-
-            # Enable compression mode
-            self._backend.write(b"M\x02")
+        # Timings are only taken with an observer attached, the checks below
+        # are all the overhead otherwise.
+        observer = self.observer
+        target = self._backend
+        if observer is not None:
+            job_start = perf_counter()
+            observer.job_started(job)
+            target = ObservedBackend(self._backend, observer)
+
+        # Each page is sent in as few transfers as the backend allows. Long
+        # or streamed pages are flushed as soon as the buffer is full, so the
+        # memory used does not grow with the page length.
+        backend = BufferedBackend(target, max_buffer=self._MAX_BUFFER)
+        lines = {}
+        pages = iter(job)
+        page = next(pages, None)
+        index = 0
+        while page is not None:
+            if observer is not None:
+                page_start = perf_counter()
+                observer.page_started(index, page)
+            backend.write(preamble.first if index == 0 else preamble.following)
 
             # send rastered lines
-            for line in page:
-                logging.debug(f"line: {line}")
-                self._backend.write(
-                    b"G" + encode_line(line, offset), timeout=timeout)
-
-            self._backend.write(b"Z")
-
-            logging.debug(f"i: {i}")
-            if i < len(job) - 1:
-                self._backend.write(b"\x0C")
-
-                while not self.__is_print_finished(page.length*100):
-                    pass
-
-        # end page
-        self._backend.write(b"\x1A")
+            chunks = _encode_chunks(page, offset, self._CHUNK_LINES, self._MAX_BUFFER, lines,
+                                    self._FEATURE_ZERO_RASTER)
+            if observer is None:
+                for _, encoded in chunks:
+                    backend.write(encoded, timeout=timeout)
+            else:
+                while True:
+                    encode_start = perf_counter()
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    raw, encoded = chunk
+                    observer.chunk_encoded(index, raw, len(encoded), perf_counter() - encode_start)
+                    backend.write(encoded, timeout=timeout)
+
+            backend.write(b"Z")
+            # send the page before rendering the next one, whether it ends
+            # with a form feed or the job is only known once it is fetched
+            backend.flush()
+
+            next_page = next(pages, None)
+            if next_page is not None:
+                backend.write(b"\x0C")
+                backend.flush()
+                if observer is not None:
+                    observer.page_sent(index, perf_counter() - page_start)
+
+                if hasattr(self._backend, "read"):
+                    wait_start = perf_counter()
+                    self._monitor.wait_for_page(target, page.length * self._PAGE_TIMEOUT_PER_LINE)
+                    if observer is not None:
+                        observer.page_printed(index, perf_counter() - wait_start)
+            else:
+                # end page
+                backend.write(b"\x1A")
+                backend.flush()
+                if observer is not None:
+                    observer.page_sent(index, perf_counter() - page_start)
+            page = next_page
+            index += 1
+
+        if index == 0:
+            backend.write(b"\x1A")
+            backend.flush()
+        if observer is not None:
+            observer.job_finished(job, perf_counter() - job_start)
         logger.info("end of page")
-
-    def __is_print_finished(self, timeout):
-        data = self._backend.read(32, timeout)
-        while data is None:
-            data = self._backend.read(32, timeout)
-
-        return Status(data).status == StatusCodes.PRINTING_DONE
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from logging import getLogger
+from typing import Type
+
+from . import GenericPrinter, _encode_chunks
+from .monitor import StatusMonitor
+from .preamble import get_preamble
+from .status import Status
+from ..backends.aio import AsyncBackend
+from ..job import Job
+
+logger = getLogger(__name__)
+
+
+class AsyncGenericPrinter:
+    """asyncio counterpart of GenericPrinter.
+
+    model is the printer class whose features (supported resolutions, half
+    cut) apply to the jobs. Many printers can be driven concurrently from a
+    single event loop."""
+
+    def __init__(
+        self,
+        backend: AsyncBackend,
+        model: Type[GenericPrinter] = GenericPrinter,
+        monitor: StatusMonitor | None = None,
+    ) -> None:
+        self._backend = backend
+        self._model = model
+        self._monitor = monitor if monitor is not None else StatusMonitor()
+
+    async def reset(self):
+        await self._backend.write(b"\x00" * 100 + b"\x1b@")  # Invalidate and initialize command
+
+    async def get_status(self) -> Status:
+        await self.reset()
+        await self._backend.write(b"\x1BiS")
+        data = await self._backend.read(32, self._monitor.read_timeout)
+        if not data:
+            raise IOError("No Response from printer")
+
+        if len(data) < 32:
+            raise IOError("Invalid Response from printer")
+
+        return Status(bytes(data))
+
+    async def print(self, job: Job, timeout: int = 1000):
+        logger.info("starting print")
+
+        await self.reset()
+
+        preamble = get_preamble(self._model, job)
+        offset = job.media.value.lmargin
+
+        data = bytearray()
+        lines = {}
+        pages = iter(job)
+        page = next(pages, None)
+        first = True
+        while page is not None:
+            data += preamble.first if first else preamble.following
+            first = False
+
+            # send rastered lines
+            chunks = _encode_chunks(page, offset, self._model._CHUNK_LINES, self._model._MAX_BUFFER, lines,
+                                    self._model._FEATURE_ZERO_RASTER)
+            for _, encoded in chunks:
+                data += encoded
+                if len(data) > self._model._MAX_BUFFER:
+                    await self._write(bytes(data), timeout)
+                    data.clear()
+
+            data += b"Z"
+            # send the page before rendering the next one, like GenericPrinter
+            await self._write(bytes(data), timeout)
+            data.clear()
+
+            next_page = next(pages, None)
+            if next_page is not None:
+                await self._write(b"\x0C", timeout)
+
+                if self._can_read():
+                    await self._monitor.async_wait_for_page(
+                        self._backend, page.length * self._model._PAGE_TIMEOUT_PER_LINE)
+            page = next_page
+
+        # end page
+        data += b"\x1A"
+        await self._write(bytes(data), timeout)
+        logger.info("end of page")
+
+    def _can_read(self) -> bool:
+        return type(self._backend).read is not AsyncBackend.read
+
+    async def _write(self, data: bytes, timeout: int) -> None:
+        chunk_size = self._backend.write_chunk_size or len(data)
+        for i in range(0, len(data), chunk_size):
+            await self._backend.write(data[i : i + chunk_size], timeout=timeout)
@@ -1,16 +1,26 @@
 from ..constants import ErrorCodes
 
+_ERROR_CODES = {err.name: err.value for err in ErrorCodes}
+_ALL_ERRORS = sum(_ERROR_CODES.values())
+
 
 class Error:
+    """The error information of a status reply. Every error of ErrorCodes is
+    available as boolean attribute, e.g. errors.NO_MEDIA."""
+
+    __slots__ = ("value",)
+
     def __init__(self, byte1: int, byte2: int) -> None:
-        value = byte1 | (byte2 << 8)
-        self._errors = {err.name: bool(value & err_code) for err_code, err in {x.value: x for x in ErrorCodes}.items()}
+        self.value = byte1 | (byte2 << 8)
 
     def any(self):
-        return any(self._errors.values())
+        return bool(self.value & _ALL_ERRORS)
 
     def __getattr__(self, attr):
-        return self._errors[attr]
+        try:
+            return bool(self.value & _ERROR_CODES[attr])
+        except KeyError:
+            raise AttributeError(f"Unknown error {attr}") from None
 
     def __repr__(self):
-        return "<Errors {}>".format(self._errors)
+        return "<Errors {}>".format({name: bool(self.value & code) for name, code in _ERROR_CODES.items()})
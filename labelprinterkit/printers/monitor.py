@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+from logging import getLogger
+from time import monotonic, sleep
+from typing import AsyncIterator, Callable, Iterator
+
+from .status import Status
+from .. import BrotherPrinterError
+from ..backends import BaseBackend
+from ..constants import StatusCodes
+
+logger = getLogger(__name__)
+
+StatusCallback = Callable[[Status], None]
+
+
+class StatusMonitor:
+    """Waits for status replies of a printer without busy looping.
+
+    The backend is polled with a short read timeout. While the printer does not
+    answer, the pause between two polls grows from poll_interval by the factor
+    backoff up to max_poll_interval. Every reply is passed to on_status, a
+    PRINTING_DONE reply to on_page_done and an ERROR_OCCURRED reply to
+    on_error."""
+
+    def __init__(
+        self,
+        poll_interval: float = 0.01,
+        max_poll_interval: float = 0.1,
+        backoff: float = 2.0,
+        read_timeout: int = 100,
+        on_status: StatusCallback | None = None,
+        on_page_done: StatusCallback | None = None,
+        on_error: StatusCallback | None = None,
+    ) -> None:
+        if poll_interval <= 0 or max_poll_interval < poll_interval:
+            raise ValueError(f"Invalid poll interval: {poll_interval} - {max_poll_interval}")
+        if backoff < 1:
+            raise ValueError(f"backoff has to be at least 1: {backoff}")
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.read_timeout = read_timeout
+        self.on_status = on_status
+        self.on_page_done = on_page_done
+        self.on_error = on_error
+
+    def statuses(self, backend: BaseBackend, timeout: float | None = None) -> Iterator[Status]:
+        """Yield the status replies of the printer until timeout seconds passed"""
+        deadline = None if timeout is None else monotonic() + timeout
+        interval = self.poll_interval
+        while True:
+            # a printer answering with other replies must not extend the wait
+            if deadline is not None and monotonic() >= deadline:
+                return
+            data = backend.read(32, self.read_timeout)
+            if data and len(data) >= 32:
+                interval = self.poll_interval
+                status = Status(bytes(data))
+                if self.on_status is not None:
+                    self.on_status(status)
+                yield status
+                continue
+            if deadline is not None:
+                remaining = deadline - monotonic()
+                sleep(max(0.0, min(interval, remaining)))
+            else:
+                sleep(interval)
+            interval = min(interval * self.backoff, self.max_poll_interval)
+
+    async def async_statuses(self, backend, timeout: float | None = None) -> AsyncIterator[Status]:
+        """Like statuses, but for an AsyncBackend and without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        interval = self.poll_interval
+        while True:
+            if deadline is not None and loop.time() >= deadline:
+                return
+            data = await backend.read(32, self.read_timeout)
+            if data and len(data) >= 32:
+                interval = self.poll_interval
+                status = Status(bytes(data))
+                if self.on_status is not None:
+                    self.on_status(status)
+                yield status
+                continue
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                await asyncio.sleep(max(0.0, min(interval, remaining)))
+            else:
+                await asyncio.sleep(interval)
+            interval = min(interval * self.backoff, self.max_poll_interval)
+
+    def wait_for_page(self, backend: BaseBackend, timeout: float | None = None) -> Status:
+        """Wait until the printer reports the current page as printed.
+
+        Raises a BrotherPrinterError as soon as the printer reports an error and
+        a TimeoutError if the page is not done within timeout seconds."""
+        for status in self.statuses(backend, timeout):
+            if self._is_page_done(status):
+                return status
+        raise TimeoutError(f"Printer did not finish the page within {timeout} s")
+
+    async def async_wait_for_page(self, backend, timeout: float | None = None) -> Status:
+        """Like wait_for_page, but for an AsyncBackend"""
+        async for status in self.async_statuses(backend, timeout):
+            if self._is_page_done(status):
+                return status
+        raise TimeoutError(f"Printer did not finish the page within {timeout} s")
+
+    def _is_page_done(self, status: Status) -> bool:
+        logger.debug("status while waiting for page: %s", status.status)
+        if status.status == StatusCodes.PRINTING_DONE:
+            if self.on_page_done is not None:
+                self.on_page_done(status)
+            return True
+        if status.status == StatusCodes.ERROR_OCCURRED:
+            if self.on_error is not None:
+                self.on_error(status)
+            raise BrotherPrinterError(f"Printer reported an error: {status.errors}")
+        return False
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import NamedTuple
+
+from ..backends import BaseBackend
+from ..job import Job
+from ..page import PageType
+
+
+class PrintObserver:
+    """Receives timings and counters of GenericPrinter.print.
+
+    Pages are counted from 0. Raster data is encoded in chunks of lines, so
+    chunk_encoded is called several times for long pages. All methods do
+    nothing, subclasses override the ones they are interested in. Without an
+    observer, GenericPrinter.print takes no timings at all."""
+
+    def job_started(self, job: Job) -> None: ...
+
+    def page_started(self, index: int, page: PageType) -> None: ...
+
+    def chunk_encoded(self, index: int, raw_bytes: int, encoded_bytes: int, seconds: float) -> None: ...
+
+    def page_sent(self, index: int, seconds: float) -> None: ...
+
+    def page_printed(self, index: int, seconds: float) -> None: ...
+
+    def backend_write(self, size: int, seconds: float) -> None: ...
+
+    def status_polled(self, data: bytes | None) -> None: ...
+
+    def job_finished(self, job: Job, seconds: float) -> None: ...
+
+
+class PageStats(NamedTuple):
+    lines: int
+    raw_bytes: int
+    encoded_bytes: int
+    encode_seconds: float
+    # from the start of the page until it was handed to the backend
+    send_seconds: float
+    # waiting for PRINTING_DONE, 0 if the printer was not asked
+    print_seconds: float
+
+
+class JobStats(NamedTuple):
+    pages: list[PageStats]
+    seconds: float
+    writes: int
+    bytes_written: int
+    write_seconds: float
+    status_polls: int
+    # polls the printer did not answer
+    status_retries: int
+
+    @property
+    def compression_ratio(self) -> float:
+        raw = sum(page.raw_bytes for page in self.pages)
+        encoded = sum(page.encoded_bytes for page in self.pages)
+        return raw / encoded if encoded else 0.0
+
+
+class PrintRecorder(PrintObserver):
+    """Observer collecting a JobStats for every job printed, see jobs"""
+
+    def __init__(self) -> None:
+        self.jobs: list[JobStats] = []
+        self._pages: list[dict] = []
+        self._counters: dict[str, float] = {}
+
+    def job_started(self, job: Job) -> None:
+        self._pages = []
+        self._counters = dict(writes=0, bytes_written=0, write_seconds=0.0, status_polls=0, status_retries=0)
+
+    def page_started(self, index: int, page: PageType) -> None:
+        self._pages.append(dict(lines=page.length, raw_bytes=0, encoded_bytes=0, encode_seconds=0.0,
+                                send_seconds=0.0, print_seconds=0.0))
+
+    def chunk_encoded(self, index: int, raw_bytes: int, encoded_bytes: int, seconds: float) -> None:
+        page = self._pages[index]
+        page["raw_bytes"] += raw_bytes
+        page["encoded_bytes"] += encoded_bytes
+        page["encode_seconds"] += seconds
+
+    def page_sent(self, index: int, seconds: float) -> None:
+        self._pages[index]["send_seconds"] = seconds
+
+    def page_printed(self, index: int, seconds: float) -> None:
+        self._pages[index]["print_seconds"] = seconds
+
+    def backend_write(self, size: int, seconds: float) -> None:
+        self._counters["writes"] += 1
+        self._counters["bytes_written"] += size
+        self._counters["write_seconds"] += seconds
+
+    def status_polled(self, data: bytes | None) -> None:
+        self._counters["status_polls"] += 1
+        if not data:
+            self._counters["status_retries"] += 1
+
+    def job_finished(self, job: Job, seconds: float) -> None:
+        pages = [PageStats(**page) for page in self._pages]
+        self.jobs.append(JobStats(pages, seconds, **self._counters))
+
+
+class ObservedBackend(BaseBackend):
+    """Reports the writes and status reads of backend to an observer"""
+
+    def __init__(self, backend: BaseBackend, observer: PrintObserver) -> None:
+        self._backend = backend
+        self._observer = observer
+
+    @property
+    def write_chunk_size(self) -> int | None:
+        return self._backend.write_chunk_size
+
+    def write(self, data: bytes, timeout=None) -> None:
+        start = perf_counter()
+        self._backend.write(data, timeout)
+        self._observer.backend_write(len(data), perf_counter() - start)
+
+    def read(self, count: int, timeout=None) -> bytes | None:
+        data = self._backend.read(count, timeout)
+        self._observer.status_polled(data)
+        return data
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from logging import getLogger
+from queue import Full, Queue
+from typing import Callable, Iterable, Iterator
+
+from . import GenericPrinter, _encode_chunks
+from .preamble import get_preamble
+from ..backends.buffered import BufferedBackend
+from ..job import Job
+from ..labels.label import Label
+from ..page import PageType
+
+logger = getLogger(__name__)
+
+_END = object()
+
+
+class PipelinedPrinter:
+    """Prints with rendering, encoding and transmission overlapping.
+
+    Pages are rendered from their sources by a pool of render_workers threads,
+    encoded by a second thread and sent by the calling thread. The stages are
+    connected by queues holding at most queue_size pages, so page N is printed
+    while page N + 1 is encoded and the following pages are rendered."""
+
+    def __init__(self, printer: GenericPrinter, render_workers: int = 2, queue_size: int = 2) -> None:
+        if render_workers < 1 or queue_size < 1:
+            raise ValueError("render_workers and queue_size have to be at least 1")
+        self._printer = printer
+        self._render_workers = render_workers
+        self._queue_size = queue_size
+
+    def print(self, job: Job, sources: Iterable = (), render: Callable[..., PageType] | None = None,
+              timeout: int = 1000):
+        """Print the pages of job followed by a page rendered by render for each
+        of sources, by default a Label at the resolution of job for each Item."""
+        if render is None:
+            render = partial(Label, resolution=job.resolution)
+        printer = self._printer
+        preamble = get_preamble(type(printer), job)
+        offset = job.media.value.lmargin
+        encoded: Queue = Queue(self._queue_size)
+        stop = threading.Event()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    encoded.put(item, timeout=0.1)
+                    return True
+                except Full:
+                    pass
+            return False
+
+        def encode(pages: Iterator[PageType]):
+            lines = {}
+            try:
+                for page in pages:
+                    job._check_page(page)
+                    chunks = _encode_chunks(page, offset, printer._CHUNK_LINES, printer._MAX_BUFFER, lines,
+                                            printer._FEATURE_ZERO_RASTER)
+                    raster = b"".join(encoded for _, encoded in chunks)
+                    if not put((page, raster)):
+                        return
+                put(_END)
+            except BaseException as e:
+                put(e)
+
+        logger.info("starting pipelined print")
+        printer.reset()
+        with ThreadPoolExecutor(self._render_workers, thread_name_prefix="render") as executor:
+            pages = _chain(job, self._rendered(executor, sources, render, stop))
+            encoder = threading.Thread(target=encode, args=(pages,), name="encode", daemon=True)
+            encoder.start()
+            try:
+                self._transmit(encoded, preamble, timeout)
+            finally:
+                stop.set()
+                encoder.join()
+        logger.info("end of page")
+
+    def _rendered(self, executor, sources, render, stop) -> Iterator[PageType]:
+        pending = deque()
+        try:
+            for source in sources:
+                if stop.is_set():
+                    return
+                pending.append(executor.submit(render, source))
+                if len(pending) > self._queue_size:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _transmit(self, encoded: Queue, preamble, timeout: int):
+        printer = self._printer
+        backend = BufferedBackend(printer._backend, max_buffer=printer._MAX_BUFFER)
+        item = _get(encoded)
+        first = True
+        while item is not _END:
+            page, raster = item
+            backend.write(preamble.first if first else preamble.following)
+            first = False
+            backend.write(raster, timeout=timeout)
+            backend.write(b"Z")
+            backend.flush()
+
+            item = _get(encoded)
+            if item is not _END:
+                backend.write(b"\x0C")
+                backend.flush()
+
+                if hasattr(printer._backend, "read"):
+                    printer._monitor.wait_for_page(printer._backend, page.length * printer._PAGE_TIMEOUT_PER_LINE)
+
+        # end page
+        backend.write(b"\x1A")
+        backend.flush()
+
+
+def _chain(job: Job, rendered: Iterator[PageType]) -> Iterator[PageType]:
+    yield from job
+    yield from rendered
+
+
+def _get(encoded: Queue):
+    item = encoded.get()
+    if isinstance(item, BaseException):
+        raise item
+    return item
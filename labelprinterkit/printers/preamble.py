@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from logging import getLogger
+from typing import NamedTuple
+
+from ..constants import AdvancedModeSettings, Media, Resolution, VariousModesSettings
+
+logger = getLogger(__name__)
+
+PREAMBLE_CACHE_SIZE = 128
+
+
+class JobPreamble(NamedTuple):
+    """Commands sent in front of the raster data of every page of a job"""
+    first: bytes
+    following: bytes
+
+
+def get_preamble(printer: type, job) -> JobPreamble:
+    """Get the preamble for the settings of job on a printer class.
+
+    The preamble only depends on the job settings, so it is compiled once
+    per distinct settings and shared between all jobs using them."""
+    return compile_preamble(
+        printer,
+        job.media,
+        job.auto_cut,
+        job.mirror_printing,
+        job.half_cut,
+        job.chain,
+        job.special_tape,
+        job.resolution,
+        job.cut_each,
+    )
+
+
+@lru_cache(maxsize=PREAMBLE_CACHE_SIZE)
+def compile_preamble(
+    printer: type,
+    media: Media,
+    auto_cut: bool,
+    mirror_printing: bool,
+    half_cut: bool,
+    chain: bool,
+    special_tape: bool,
+    resolution: Resolution,
+    cut_each: int,
+) -> JobPreamble:
+    if media in (Media.NO_MEDIA, Media.UNSUPPORTED_MEDIA):
+        raise RuntimeError("Unsupported Media")
+
+    if resolution not in printer._SUPPORTED_RESOLUTIONS:
+        raise RuntimeError("Resolution is not supported by this printer.")
+
+    media_type = media.value.media_type.value.to_bytes(1, "big")
+    media_size = media.value.width.to_bytes(1, "big")
+
+    various_mode = 0
+    if auto_cut:
+        various_mode = various_mode | VariousModesSettings.AUTO_CUT.value
+    if mirror_printing:
+        various_mode = various_mode | VariousModesSettings.MIRROR_PRINTING.value
+    various_mode = various_mode.to_bytes(1, "big")
+
+    advanced_mode = 0
+    if half_cut:
+        if not printer._FEATURE_HALF_CUT:
+            raise RuntimeError(
+                "Half cut is not supported by this printer.")
+        advanced_mode = advanced_mode | AdvancedModeSettings.HALF_CUT.value
+    if not chain:
+        advanced_mode = advanced_mode | AdvancedModeSettings.CHAIN_PRINTING.value
+    if special_tape:
+        advanced_mode = advanced_mode | AdvancedModeSettings.SPECIAL_TAPE.value
+    if resolution == Resolution.HIGH:
+        margin = b"\x1C\x00"
+        advanced_mode = advanced_mode | AdvancedModeSettings.HIGH_RESOLUTION.value
+    else:
+        margin = b"\x0E\x00"
+    advanced_mode = advanced_mode.to_bytes(1, "big")
+
+    logger.debug("various_mode: %s, advanced_mode: %s", various_mode, advanced_mode)
+
+    # switch dynamic command mode: enable raster mode
+    raster_mode = b"\x1Bia\x01"
+
+    # Print information command
+    # b'\x1Biz\x86\x01\x0c\x00\x00\x00\00\x00\x00'
+    information_command = b"\x1Biz\x86" + media_type + \
+        media_size + b"\x00\x00\x00\00\x00\x00"
+
+    modes = b"\x1BiM" + various_mode + b"\x1biK" + advanced_mode + b"\x1bid" + margin
+    if auto_cut:
+        # Configure after how many pages a cut should be done
+        modes += b"\x1BiA" + cut_each.to_bytes(1, "big")
+
+    # Enable compression mode
+    modes += b"M\x02"
+
+    following = raster_mode + information_command + modes
+    if auto_cut:
+        # Ugly workaround
+        # Print information command a second time forces cutting after first page.
+        # No idea why this is needed, but it works
+        first = raster_mode + information_command + information_command + modes
+    else:
+        first = following
+    return JobPreamble(first, following)
+
+
+def preamble_cache_info():
+    """Hit and miss counters of the shared preamble cache"""
+    return compile_preamble.cache_info()
+
+
+def preamble_cache_clear() -> None:
+    compile_preamble.cache_clear()
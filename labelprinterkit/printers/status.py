@@ -1,61 +1,77 @@
+import struct
+
 from .error import Error
-from ..constants import Media, MediaType, NotificationCodes, StatusCodes, TapeColor, TextColor
+from ..constants import Media, MediaType, NotificationCodes, PhaseType, StatusCodes, TapeColor, TextColor
+
+_MEDIA_TYPES = {x.value: x for x in MediaType}
+_STATUS_CODES = {x.value: x for x in StatusCodes}
+_PHASE_TYPES = {x.value: x for x in PhaseType}
+_NOTIFICATION_CODES = {x.value: x for x in NotificationCodes}
+_TAPE_COLORS = {x.value: x for x in TapeColor}
+_TEXT_COLORS = {x.value: x for x in TextColor}
+
+_STATUS = struct.Struct(
+    ">"  # the phase number is sent higher order byte first
+    "4x"  # Print head mark, size, Brother code, series code
+    "B"  # Model code
+    "3x"  # Country code, reserved
+    "BB"  # Error information 1 and 2
+    "B"  # Media width
+    "B"  # Media type
+    "5x"  # Number of colors, fonts, Japanese fonts, mode, density
+    "B"  # Media length
+    "B"  # Status type
+    "B"  # Phase type
+    "H"  # Phase number
+    "B"  # Notification number
+    "x"  # Expansion area
+    "B"  # Tape color
+    "B"  # Text color
+    "4s"  # Hardware settings
+    "2x"  # Reserved
+)
 
 
 class Status:
+    """A 32 byte status reply of the printer"""
+
+    __slots__ = ("model", "errors", "media_width", "media_type", "media_length", "status", "phase_type",
+                 "phase_number", "notification", "tape_color", "text_color", "hardware_settings", "_media")
+
     def __init__(self, data: bytes) -> None:
-        _data = dict()
-        # assert data[0] == 0x80  # Print head mark
-        # assert data[1] == 0x20  # Size
-        # assert data[2] == 0x42  # Brother code
-        # assert data[3] == 0x30  # Series code
-        _data["model"] = data[4]  # Model code
-        # assert data[4] == 0x30  # Country code
-        # assert data[5] == 0x00  # Reserved
-        # assert data[6] == 0x00  # Reserved
-        _data["errors"] = Error(data[8], data[9])
-        _data["media_width"] = int(data[10])
         try:
-            _data["media_type"] = {x.value: x for x in MediaType}[int(data[11])]
-        except IndexError:
-            raise RuntimeError("Unsupported media type {data[11]}")
-        # assert data[12] == 0x00  # Number of colors
-        # assert data[13] == 0x00  # Fonts
-        # assert data[14] == 0x00  # Japanese Fonts
-        # assert data[15] == 0x00  # Mode
-        # assert data[16] == 0x00  # Density
-        # assert data[17] == 0x00  # Media length
+            (self.model, error1, error2, self.media_width, media_type, self.media_length, status, phase_type,
+             self.phase_number, notification, tape_color, text_color, self.hardware_settings) = \
+                _STATUS.unpack_from(data)
+        except struct.error:
+            raise IOError(f"Invalid status of {len(data)} bytes")
+        self.errors = Error(error1, error2)
         try:
-            _data["status"] = {x.value: x for x in StatusCodes}[int(data[18])]
-        except IndexError:
-            raise RuntimeError("Unknown status {data[18]}")
-        # assert data[19] == 0x00  # Phase type
-        # assert data[20] == 0x00  # Phase number (higher order bytes)
-        # assert data[21] == 0x00  # Phase number (lower order bytes)
+            self.media_type = _MEDIA_TYPES[media_type]
+        except KeyError:
+            raise RuntimeError(f"Unsupported media type {media_type}") from None
         try:
-            _data["notification"] = {x.value: x for x in NotificationCodes}[int(data[22])]
-        except IndexError:
-            raise RuntimeError("Unknown notification {data[18]}")
-        # assert data[23] == 0x00  # Expansion area
+            self.status = _STATUS_CODES[status]
+        except KeyError:
+            raise RuntimeError(f"Unknown status {status}") from None
+        # only informational, an unknown phase type must not fail the status
+        self.phase_type = _PHASE_TYPES.get(phase_type, phase_type)
         try:
-            _data["tape_color"] = {x.value: x for x in TapeColor}[int(data[24])]
-        except IndexError:
-            raise RuntimeError("Unknown tape color {data[18]}")
+            self.notification = _NOTIFICATION_CODES[notification]
+        except KeyError:
+            raise RuntimeError(f"Unknown notification {notification}") from None
         try:
-            _data["text_color"] = {x.value: x for x in TextColor}[int(data[25])]
-        except IndexError:
-            raise RuntimeError("Unknown text color {data[18]}")
-        # data[26:29]  # Hardware settings
-        # data[30:31] Reserved
-
-        self._data = _data
+            self.tape_color = _TAPE_COLORS[tape_color]
+        except KeyError:
+            raise RuntimeError(f"Unknown tape color {tape_color}") from None
+        try:
+            self.text_color = _TEXT_COLORS[text_color]
+        except KeyError:
+            raise RuntimeError(f"Unknown text color {text_color}") from None
         self._media = None
 
     def __repr__(self) -> str:
-        return "<Status {}>".format(self._data)
-
-    def __getattr__(self, attr):
-        return self._data[attr]
+        return "<Status {}>".format({name: getattr(self, name) for name in self.__slots__[:-1]})
 
     def ready(self) -> bool:
         return not self.errors.any()
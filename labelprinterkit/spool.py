@@ -0,0 +1,188 @@
+"""On disk spool format for jobs, to print them later or again without
+rendering their pages anew.
+
+A spool file starts with a header holding the job settings, followed by the
+page rasters and a table of the pages. Rasters are stored either raw or as the
+PackBits encoded G raster commands sent to the printer. Spool files are read
+through mmap, so the pages of a spooled job are only paged in from disk while
+they are printed."""
+from __future__ import annotations
+
+import mmap
+import struct
+from os import PathLike
+
+from .constants import Media, Resolution
+from .job import Job
+from .page import BasePage, Page
+from .printers import GenericPrinter, decode_page, encode_page
+
+MAGIC = b"LPKSPOOL"
+VERSION = 1
+
+RAW = 0
+PACKBITS = 1
+
+# magic, version, media, auto_cut, mirror_printing, half_cut, chain,
+# special_tape, cut_each, resolution
+_MEDIA_NAME_SIZE = 16
+_HEADER = struct.Struct(f"<8sB{_MEDIA_NAME_SIZE}s5?B8s")
+# width, length, encoding, offset, size
+_PAGE = struct.Struct("<IIBQQ")
+# page table offset, page count, magic
+_FOOTER = struct.Struct("<QI8s")
+
+
+class SpooledJob(Job):
+    """Job read from a spool file, with the page rasters mapped from the file.
+
+    close releases the mapping, so the spool file can be replaced or deleted.
+    The pages of the job cannot be printed afterwards and views of their
+    rasters taken before have to be released first."""
+
+    def __init__(self, mapping: mmap.mmap, media: Media, **kwargs) -> None:
+        super().__init__(media, **kwargs)
+        self._mapping = mapping
+        self._view = memoryview(mapping)
+        self._rasters: list[memoryview] = []
+
+    def close(self) -> None:
+        if self._mapping.closed:
+            return
+        for page in self._pages:
+            page._release()
+        for raster in self._rasters:
+            raster.release()
+        self._view.release()
+        self._mapping.close()
+
+    def __enter__(self) -> SpooledJob:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class EncodedPage(BasePage):
+    """Page holding the G raster commands for a left margin of padding instead
+    of a bitmap. The bitmap is only decoded when it is accessed."""
+
+    def __init__(self, encoded: bytes, width: int, length: int, resolution: Resolution, padding: int):
+        self._encoded = encoded
+        self._padding = padding
+        self._bitmap = None
+        self._width = width
+        self._length = length
+        self._resolution = resolution
+        super().__init__()
+
+    def _check_bitmap(self):
+        pass
+
+    @property
+    def bitmap(self) -> bytes:
+        if self._bitmap is None:
+            self._bitmap = decode_page(self._encoded, self.width, self._padding)
+            if len(self._bitmap) != self._byte_per_line * self.length:
+                raise IOError(f"Encoded page holds {len(self._bitmap) // self._byte_per_line} lines "
+                              f"instead of {self.length}")
+        return self._bitmap
+
+    @property
+    def raster(self) -> memoryview:
+        return memoryview(self.bitmap)
+
+    def encoded(self, padding: int) -> bytes | None:
+        if padding != self._padding:
+            return None
+        return self._encoded
+
+
+def write_spool(job: Job, path: str | PathLike, encode: bool = True) -> int:
+    """Write job to a spool file at path and return the number of pages.
+
+    With encode, the rasters are stored PackBits encoded for the media of the
+    job, otherwise raw. Lazily added pages are consumed."""
+    padding = job.media.value.lmargin
+    chunk_lines = GenericPrinter._CHUNK_LINES
+    table = []
+    media = job.media.name.encode()
+    if len(media) > _MEDIA_NAME_SIZE:
+        raise ValueError(f"Media {job.media.name} cannot be spooled")
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(
+            MAGIC, VERSION, media, job.auto_cut, job.mirror_printing, job.half_cut, job.chain,
+            job.special_tape, job.cut_each, job.resolution.name.encode()))
+        for page in job:
+            offset = file.tell()
+            if encode:
+                encoded = page.encoded(padding)
+                if encoded is not None:
+                    file.write(encoded)
+                else:
+                    for chunk in page.chunks(chunk_lines):
+                        file.write(encode_page(chunk, page.width, padding))
+            else:
+                for chunk in page.chunks(chunk_lines):
+                    file.write(chunk)
+            table.append(_PAGE.pack(page.width, page.length, PACKBITS if encode else RAW, offset,
+                                    file.tell() - offset))
+        table_offset = file.tell()
+        file.write(b"".join(table))
+        file.write(_FOOTER.pack(table_offset, len(table), MAGIC))
+    return len(table)
+
+
+def read_spool(path: str | PathLike) -> SpooledJob:
+    """Read a job from the spool file at path. Close the job to release the
+    mapping of the file."""
+    with open(path, "rb") as file:
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise IOError(f"{path} is empty")
+    try:
+        return _read_job(data, path)
+    except BaseException:
+        data.close()
+        raise
+
+
+def _read_job(data: mmap.mmap, path: str | PathLike) -> SpooledJob:
+    if len(data) < _HEADER.size + _FOOTER.size:
+        raise IOError(f"{path} is not a spool file")
+    magic, version, media, auto_cut, mirror_printing, half_cut, chain, special_tape, cut_each, resolution = \
+        _HEADER.unpack_from(data)
+    table_offset, count, end_magic = _FOOTER.unpack_from(data, len(data) - _FOOTER.size)
+    if magic != MAGIC or end_magic != MAGIC:
+        raise IOError(f"{path} is not a spool file")
+    if version != VERSION:
+        raise IOError(f"Unsupported spool version {version}")
+
+    job = SpooledJob(
+        data,
+        Media[media.rstrip(b"\x00").decode()],
+        auto_cut=auto_cut,
+        mirror_printing=mirror_printing,
+        half_cut=half_cut,
+        chain=chain,
+        special_tape=special_tape,
+        cut_each=cut_each,
+        resolution=Resolution[resolution.rstrip(b"\x00").decode()],
+    )
+    padding = job.media.value.lmargin
+    try:
+        for width, length, encoding, offset, size in _PAGE.iter_unpack(
+                data[table_offset : table_offset + count * _PAGE.size]):
+            raster = job._view[offset : offset + size]
+            job._rasters.append(raster)
+            if encoding == PACKBITS:
+                job.add_page(EncodedPage(raster, width, length, job.resolution, padding))
+            elif encoding == RAW:
+                job.add_page(Page(raster, width, length, job.resolution))
+            else:
+                raise IOError(f"Unknown page encoding {encoding}")
+    except BaseException:
+        job.close()
+        raise
+    return job
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from math import ceil
+from typing import Callable, Hashable, NamedTuple
+
+from PIL import Image
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+
+class RenderCache:
+    """Thread safe LRU cache for rendered 1-bit images.
+
+    The cache holds at most max_entries images taking up at most max_bytes of
+    pixel data. Images are copied on the way in and out, so callers are free
+    to modify what they get, unless they ask for the cached image itself."""
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._images: OrderedDict[Hashable, tuple[Image.Image, int]] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable, render: Callable[[], Image.Image], copy: bool = True) -> Image.Image:
+        """Get the image cached for key or render and cache it. With copy
+        False, the cached image itself is returned and must not be modified."""
+        if not self.enabled:
+            return render()
+        with self._lock:
+            cached = self._images.get(key)
+            if cached is not None:
+                self._images.move_to_end(key)
+                self._hits += 1
+                return cached[0].copy() if copy else cached[0]
+            self._misses += 1
+        image = render()
+        self.put(key, image)
+        return image
+
+    def put(self, key: Hashable, image: Image.Image) -> None:
+        size = self._image_size(image)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._images:
+                self._size -= self._images.pop(key)[1]
+            self._images[key] = (image.copy(), size)
+            self._size += size
+            while len(self._images) > self.max_entries or self._size > self.max_bytes:
+                _, (_, evicted_size) = self._images.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+            self._size = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, len(self._images), self._size)
+
+    @staticmethod
+    def _image_size(image: Image.Image) -> int:
+        if image.mode == "1":
+            return ceil(image.size[0] / 8) * image.size[1]
+        return image.size[0] * image.size[1] * len(image.getbands())
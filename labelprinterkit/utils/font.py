@@ -1,7 +1,10 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import NewType
 
+from PIL import ImageFont
+
 FontPath = NewType("FontPath", Path)
 
 
@@ -16,3 +19,37 @@ def get_fonts(font_path: str | Path = LINUX_TRUETYPE_FONT_DIRECTORY) -> dict[str
         for font_variant in os.listdir(f"{font_path}/{font}"):
             fonts[font].append(FontPath(Path(f"{font_path}/{font}/{font_variant}")))
     return fonts
+
+
+def font_identity(font_path) -> tuple | None:
+    """Identify the font file behind font_path, so a changed or replaced file is
+    told apart from the old one. Returns None for fonts that are not given by
+    path, like file objects."""
+    if not isinstance(font_path, (str, os.PathLike)):
+        return None
+    try:
+        stat = os.stat(font_path)
+    except OSError:
+        # a font name resolved by FreeType from the system font directories
+        return (os.fspath(font_path),)
+    # device and inode tell the file apart no matter which path leads to it,
+    # without resolving the path component by component
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _load_font(identity: tuple, font_path, size: int, index: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(font_path, size, index)
+
+
+def get_font(font_path, size: int, index: int = 0) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, reusing the font handle of earlier calls with the
+    same font file, size and index"""
+    identity = font_identity(font_path)
+    if identity is None:
+        return ImageFont.truetype(font_path, size, index)
+    return _load_font(identity, font_path, size, index)
+
+
+def font_cache_info():
+    return _load_font.cache_info()
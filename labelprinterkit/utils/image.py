@@ -4,19 +4,33 @@ from typing import Tuple
 
 from PIL import Image, ImageChops
 
+from ..constants import Resolution
+
 def image_to_bitmap(image: Image) -> Tuple[bytes, int, int]:
+    """Convert an image into the printer raster: one line per column of the
+    image, bottom pixel first, with set bits for black pixels.
+
+    Rotating by 270 degrees and flipping top to bottom is a single transverse
+    transposition and the raw "1;I" packer inverts while packing, so only one
+    intermediate image is allocated."""
     assert image.mode == "1"
-    image = image.transpose(Image.ROTATE_270).transpose(Image.FLIP_TOP_BOTTOM)
-    image = ImageChops.invert(image)
-    return image.tobytes(), image.size[0], image.size[1]
+    image = image.transpose(Image.Transpose.TRANSVERSE)
+    return image.tobytes("raw", "1;I"), image.size[0], image.size[1]
 
 
 def bitmap_to_image(bitmap: bytes, width: int, length: int) -> Image:
-    image = Image.frombytes("1", (width, length), bitmap)
-    image = image.transpose(Image.FLIP_TOP_BOTTOM)
-    image = image.transpose(Image.ROTATE_90)
-    image = ImageChops.invert(image)
-    return image
+    image = Image.frombytes("1", (width, length), bitmap, "raw", "1;I")
+    return image.transpose(Image.Transpose.TRANSVERSE)
+
+
+def scale_to_resolution(image: Image, resolution: Resolution) -> Image:
+    """Stretch an image rendered at 180 dpi along its length (the x axis) to
+    the feed resolution of resolution. Pixels are repeated, not interpolated,
+    so the image stays black and white."""
+    _, feed_dpi = resolution.value
+    if feed_dpi == 180:
+        return image
+    return image.resize((round(image.size[0] * feed_dpi / 180), image.size[1]), Image.Resampling.NEAREST)
 
 
 def crop(im: Image) -> Image:
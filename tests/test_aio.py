@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from math import ceil
+from time import monotonic, sleep
+
+from labelprinterkit.backends.aio import AsyncTCPBackend
+from labelprinterkit.backends.simulated import SimulatedBackend, SimulatedPrinterServer
+from labelprinterkit.constants import Media
+from labelprinterkit.job import Job
+from labelprinterkit.page import Page
+from labelprinterkit.printers.aio import AsyncGenericPrinter
+from labelprinterkit.printers.main import P750W
+
+
+def make_job(media: Media, lengths: list[int], seed: int = 0) -> Job:
+    rng = random.Random(seed)
+    width = media.value.printarea
+    job = Job(media)
+    for length in lengths:
+        job.add_page(Page(rng.randbytes(ceil(width / 8) * length), width, length))
+    return job
+
+
+def decoded(job: Job) -> list[bytes]:
+    # the simulator decodes the Z ending every page as one more blank line
+    return [bytes(page.bitmap) + bytes(ceil(page.width / 8)) for page in job]
+
+
+def wait_for_pages(backend: SimulatedBackend, count: int, timeout: float = 5.0) -> list[Page]:
+    # the server decodes in its own thread, after the client closed the connection
+    deadline = monotonic() + timeout
+    while len(backend.pages) < count and monotonic() < deadline:
+        sleep(0.01)
+    return backend.pages
+
+
+async def print_job(address: tuple[str, int], job: Job) -> None:
+    backend = await AsyncTCPBackend.connect(*address)
+    async with backend:
+        await AsyncGenericPrinter(backend, P750W).print(job)
+
+
+def test_print_over_tcp():
+    job = make_job(Media.W24, [200, 31, 500])
+    with SimulatedPrinterServer(backend=SimulatedBackend(Media.W24)) as server:
+        asyncio.run(print_job(server.address, job))
+        pages = wait_for_pages(server.backend, 3)
+
+    assert [bytes(page.bitmap) for page in pages] == decoded(job)
+    assert [page.width for page in pages] == [128, 128, 128]
+
+
+def test_print_with_margin():
+    job = make_job(Media.W12, [100, 100], seed=1)
+    with SimulatedPrinterServer(backend=SimulatedBackend(Media.W12)) as server:
+        asyncio.run(print_job(server.address, job))
+        pages = wait_for_pages(server.backend, 2)
+
+    # the raster is shifted by the left margin of the media and back
+    assert [bytes(page.bitmap) for page in pages] == decoded(job)
+
+
+def test_concurrent_printers():
+    servers = [SimulatedPrinterServer(backend=SimulatedBackend(Media.W24)) for _ in range(4)]
+    jobs = [make_job(Media.W24, [150] * (index + 1), seed=index) for index in range(len(servers))]
+
+    async def print_all():
+        await asyncio.gather(*[print_job(server.address, job) for server, job in zip(servers, jobs)])
+
+    for server in servers:
+        server.start()
+    try:
+        asyncio.run(print_all())
+        for server, job in zip(servers, jobs):
+            pages = wait_for_pages(server.backend, len(decoded(job)))
+            assert [bytes(page.bitmap) for page in pages] == decoded(job)
+    finally:
+        for server in servers:
+            server.stop()
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import socket
+from time import monotonic, sleep
+
+import pytest
+
+from labelprinterkit.backends import network
+from labelprinterkit.backends.network import NetworkBackend
+
+STATUS = bytes(range(32))
+
+
+class FakeSnmp:
+    """Stand-in for the pysnmp high level API, recording how it is used"""
+
+    def __init__(self) -> None:
+        self.engines = 0
+        self.communities = []
+        self.transports = []
+        self.requests = 0
+
+    def install(self, monkeypatch) -> None:
+        monkeypatch.setattr(network, "SnmpEngine", self.engine)
+        monkeypatch.setattr(network, "CommunityData", self.community)
+        monkeypatch.setattr(network, "UdpTransportTarget", self.transport)
+        monkeypatch.setattr(network, "Udp6TransportTarget", self.transport)
+        monkeypatch.setattr(network, "ContextData", object)
+        monkeypatch.setattr(network, "ObjectType", lambda identity: identity)
+        monkeypatch.setattr(network, "ObjectIdentity", lambda oid: oid)
+        monkeypatch.setattr(network, "getCmd", self.get)
+
+    def engine(self):
+        self.engines += 1
+        return object()
+
+    def community(self, name):
+        self.communities.append(name)
+        return name
+
+    def transport(self, address, timeout):
+        self.transports.append(address)
+        return address
+
+    def get(self, engine, auth, transport, context, status_object):
+        self.requests += 1
+        assert status_object == NetworkBackend.STATUS_OID
+        yield None, 0, 0, [(status_object, STATUS)]
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def snmp(monkeypatch):
+    fake = FakeSnmp()
+    fake.install(monkeypatch)
+    return fake
+
+
+@pytest.fixture
+def printer():
+    # connections are accepted by the kernel, nothing is read from them
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    yield server.getsockname()
+    server.close()
+
+
+def test_session_reused(snmp, printer):
+    backend = NetworkBackend(*printer)
+    try:
+        assert backend.get_status() == STATUS
+        assert backend.get_status() == STATUS
+    finally:
+        backend.close()
+    assert snmp.requests == 2
+    assert snmp.engines == 1
+    assert len(snmp.transports) == 1
+
+
+def test_community_and_port(snmp, printer):
+    backend = NetworkBackend(*printer, snmp_community="private", snmp_port=1161)
+    try:
+        backend.get_status()
+    finally:
+        backend.close()
+    assert snmp.communities == ["private"]
+    assert snmp.transports == [("127.0.0.1", 1161)]
+
+
+def test_status_ttl(snmp, printer, monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(network, "monotonic", clock)
+    backend = NetworkBackend(*printer, status_ttl=2.0)
+    try:
+        backend.get_status()
+        clock.now += 1.9
+        backend.get_status()
+        assert snmp.requests == 1
+        clock.now += 0.1
+        backend.get_status()
+        assert snmp.requests == 2
+    finally:
+        backend.close()
+
+
+def test_status_polling(snmp, printer):
+    backend = NetworkBackend(*printer)
+    try:
+        backend.start_status_polling(0.01)
+        deadline = monotonic() + 5
+        while snmp.requests < 3 and monotonic() < deadline:
+            sleep(0.01)
+        assert snmp.requests >= 3
+        assert backend.get_status() == STATUS
+        backend.stop_status_polling()
+        assert backend._poller is None
+        # no poll may happen once stop_status_polling returned
+        requests = snmp.requests
+        sleep(0.05)
+        assert snmp.requests == requests
+    finally:
+        backend.close()
+    assert snmp.engines == 1